@@ -2,6 +2,7 @@ import network
 import urequests
 import time
 import math
+import struct
 import gc
 from galactic import GalacticUnicorn
 from picographics import PicoGraphics, DISPLAY_GALACTIC_UNICORN as DISPLAY
@@ -9,6 +10,445 @@ try:
     import os
 except ImportError:
     import uos as os
+try:
+    import ujson as json
+except ImportError:
+    import json
+try:
+    import usocket as socket
+except ImportError:
+    import socket
+try:
+    import ussl as ssl
+except ImportError:
+    import ssl
+try:
+    import random
+except ImportError:
+    random = None
+# Intern normalized callsigns so equal strings used as cache keys share one
+# heap object; plain identity fallback where sys.intern is unavailable
+try:
+    from sys import intern as _intern
+except ImportError:
+    def _intern(s):
+        return s
+
+# Native code emitter for the tiny-font blit loops (3-10x on integer-heavy
+# loops). No-op decorator where micropython isn't available (e.g. CPython)
+try:
+    import micropython
+    _native = micropython.native
+except (ImportError, AttributeError):
+    def _native(f):
+        return f
+
+# Bit masks for the 3 columns of a tiny-font row (MSB-first)
+_BITS = (0b100, 0b010, 0b001)
+
+# Commercial airline codes (major carriers only). Module-level so the single
+# PlaneTracker instance doesn't rebuild it on init
+COMMERCIAL_AIRLINES = frozenset({
+    'BAW', 'VIR', 'EZY', 'RYR',  # UK carriers
+    'UAL', 'AAL', 'DAL', 'JBU',  # US carriers
+    'AFR', 'DLH', 'KLM', 'IBE', 'SAS',  # European carriers
+    'UAE', 'ETD', 'QTR', 'SVA', 'THY',  # Middle East carriers
+    'SIA', 'CPA', 'JAL', 'ANA', 'QFA',  # Asia Pacific carriers
+    'ACA', 'WJA',  # Canadian carriers
+    'TAM', 'LAN',  # South American carriers
+})
+
+# Tiny 3x5 font for compact text (date/time/route)
+_TINY_FONT = {
+    '0': [0b111, 0b101, 0b101, 0b101, 0b111],
+    '1': [0b010, 0b110, 0b010, 0b010, 0b111],
+    '2': [0b111, 0b001, 0b111, 0b100, 0b111],
+    '3': [0b111, 0b001, 0b111, 0b001, 0b111],
+    '4': [0b101, 0b101, 0b111, 0b001, 0b001],
+    '5': [0b111, 0b100, 0b111, 0b001, 0b111],
+    '6': [0b111, 0b100, 0b111, 0b101, 0b111],
+    '7': [0b111, 0b001, 0b010, 0b100, 0b100],
+    '8': [0b111, 0b101, 0b111, 0b101, 0b111],
+    '9': [0b111, 0b101, 0b111, 0b001, 0b111],
+    '/': [0b001, 0b001, 0b010, 0b100, 0b100],
+    ':': [0b000, 0b010, 0b000, 0b010, 0b000],
+    '-': [0b000, 0b000, 0b111, 0b000, 0b000],
+    '>': [0b100, 0b010, 0b001, 0b010, 0b100],
+    'A': [0b010, 0b101, 0b111, 0b101, 0b101],
+    'B': [0b110, 0b101, 0b110, 0b101, 0b110],
+    'C': [0b011, 0b100, 0b100, 0b100, 0b011],
+    'D': [0b110, 0b101, 0b101, 0b101, 0b110],
+    'E': [0b111, 0b100, 0b110, 0b100, 0b111],
+    'F': [0b111, 0b100, 0b110, 0b100, 0b100],
+    'G': [0b011, 0b100, 0b101, 0b101, 0b011],
+    'H': [0b101, 0b101, 0b111, 0b101, 0b101],
+    'I': [0b111, 0b010, 0b010, 0b010, 0b111],
+    'J': [0b001, 0b001, 0b001, 0b101, 0b010],
+    'K': [0b101, 0b110, 0b100, 0b110, 0b101],
+    'L': [0b100, 0b100, 0b100, 0b100, 0b111],
+    'M': [0b101, 0b111, 0b111, 0b101, 0b101],
+    'N': [0b101, 0b111, 0b111, 0b111, 0b101],
+    'O': [0b111, 0b101, 0b101, 0b101, 0b111],
+    'P': [0b111, 0b101, 0b111, 0b100, 0b100],
+    'Q': [0b111, 0b101, 0b101, 0b111, 0b001],
+    'R': [0b111, 0b101, 0b111, 0b110, 0b101],
+    'S': [0b011, 0b100, 0b011, 0b001, 0b110],
+    'T': [0b111, 0b010, 0b010, 0b010, 0b010],
+    'U': [0b101, 0b101, 0b101, 0b101, 0b111],
+    'V': [0b101, 0b101, 0b101, 0b101, 0b010],
+    'W': [0b101, 0b101, 0b111, 0b111, 0b101],
+    'X': [0b101, 0b101, 0b010, 0b101, 0b101],
+    'Y': [0b101, 0b101, 0b010, 0b010, 0b010],
+    'Z': [0b111, 0b001, 0b010, 0b100, 0b111],
+}
+
+# Glyph rows packed into one contiguous 128*5-byte buffer indexed by
+# ord(ch)*5 + row, with a parallel presence flag per code point. One
+# allocation instead of ~40 separate row lists on the heap
+_FONT_ROWS = bytearray(128 * 5)
+_FONT_HAS = bytearray(128)
+for _ch, _rows in _TINY_FONT.items():
+    _o = ord(_ch)
+    if _o < 128:
+        _FONT_HAS[_o] = 1
+        for _r in range(5):
+            _FONT_ROWS[_o * 5 + _r] = _rows[_r]
+
+def _sock_readline(s):
+    """readline for both MicroPython stream sockets and CPython sockets."""
+    rl = getattr(s, 'readline', None)
+    if rl:
+        return rl()
+    buf = b''
+    while True:
+        c = s.recv(1)
+        if not c:
+            return buf
+        buf += c
+        if c == b'\n':
+            return buf
+
+
+def _sock_read(s, n):
+    """Bounded read for both socket flavours."""
+    rd = getattr(s, 'read', None)
+    if rd:
+        return rd(n)
+    return s.recv(n)
+
+
+def _sock_write(s, data):
+    wr = getattr(s, 'write', None)
+    if wr:
+        wr(data)
+    else:
+        s.sendall(data)
+
+
+class _BoundedRaw:
+    """File-like reader bounded by Content-Length so a keep-alive socket is
+    left positioned at the start of the next response."""
+
+    def __init__(self, sock, remaining):
+        self._sock = sock
+        self.remaining = remaining
+
+    def read(self, n=-1):
+        if self.remaining is not None and self.remaining <= 0:
+            return b''
+        if n is None or n < 0:
+            n = self.remaining if self.remaining is not None else 4096
+        elif self.remaining is not None and n > self.remaining:
+            n = self.remaining
+        if n <= 0:
+            return b''
+        try:
+            chunk = _sock_read(self._sock, n)
+        except Exception:
+            return b''
+        if chunk and self.remaining is not None:
+            self.remaining -= len(chunk)
+        return chunk or b''
+
+
+class _SessionResponse:
+    """Response from HTTPSession mirroring the bits of urequests we use:
+    status_code, headers, content, text, json(), raw and close()."""
+
+    def __init__(self, session, key, sock, status_code, headers, length, chunked):
+        self.status_code = status_code
+        self.headers = headers
+        self._session = session
+        self._key = key
+        self._sock = sock
+        self._chunked = chunked
+        self._content = None
+        # Reuse is only safe when we can frame the body by Content-Length
+        self._reusable = (length is not None and not chunked and
+                          headers.get('connection', 'keep-alive') != 'close')
+        self.raw = None if chunked else _BoundedRaw(sock, length)
+
+    @property
+    def content(self):
+        if self._content is None:
+            if self._chunked:
+                self._content = self._read_chunked()
+            else:
+                parts = []
+                while True:
+                    chunk = self.raw.read(1024)
+                    if not chunk:
+                        break
+                    parts.append(chunk)
+                self._content = b''.join(parts)
+        return self._content
+
+    @property
+    def text(self):
+        return self.content.decode()
+
+    def json(self):
+        return json.loads(self.content)
+
+    def _read_chunked(self):
+        parts = []
+        while True:
+            size_line = _sock_readline(self._sock)
+            try:
+                size = int(size_line.split(b';')[0].strip(), 16)
+            except Exception:
+                break
+            if size == 0:
+                _sock_readline(self._sock)  # trailing CRLF
+                break
+            remaining = size
+            while remaining > 0:
+                chunk = _sock_read(self._sock, min(remaining, 1024))
+                if not chunk:
+                    remaining = 0
+                    break
+                parts.append(chunk)
+                remaining -= len(chunk)
+            _sock_readline(self._sock)  # CRLF after each chunk
+        return b''.join(parts)
+
+    def close(self):
+        """Return the socket to the session pool when the body has been
+        fully consumed (or is small enough to drain); close it otherwise."""
+        sock = self._sock
+        if sock is None:
+            return
+        self._sock = None
+        if self._session and self._reusable:
+            remaining = self.raw.remaining if self.raw else None
+            if remaining is not None and remaining <= 4096:
+                while remaining > 0:
+                    chunk = _sock_read(sock, min(remaining, 1024))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                if remaining == 0:
+                    self._session._park(self._key, sock)
+                    return
+        try:
+            sock.close()
+        except Exception:
+            pass
+
+
+class HTTPSession:
+    """Minimal keep-alive HTTP/1.1 client.
+
+    Keeps one TLS/TCP socket open per host so repeated requests to the same
+    API (OpenSky, its auth realm, raw.githubusercontent.com, adsbdb) skip
+    the TCP+TLS handshake, which dominates request latency on the Pico W.
+    A stale pooled socket is retried once on a fresh connection; callers
+    are expected to fall back to urequests if the session itself fails."""
+
+    def __init__(self, timeout=10, connect_timeout=None, keepalive=True):
+        self._conns = {}
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout if connect_timeout is not None else timeout
+        self.keepalive = keepalive
+
+    def _park(self, key, sock):
+        old = self._conns.get(key)
+        if old is not None and old is not sock:
+            try:
+                old.close()
+            except Exception:
+                pass
+        self._conns[key] = sock
+
+    def _connect(self, host, port, is_tls):
+        ai = socket.getaddrinfo(host, port)[0][-1]
+        s = socket.socket()
+        try:
+            s.settimeout(self.connect_timeout)
+        except Exception:
+            pass
+        s.connect(ai)
+        if is_tls:
+            try:
+                s = ssl.wrap_socket(s, server_hostname=host)
+            except TypeError:
+                s = ssl.wrap_socket(s)
+        # Reads get their own (longer) bound than connection setup
+        try:
+            s.settimeout(self.timeout)
+        except Exception:
+            pass
+        return s
+
+    def request(self, method, url, headers=None, data=None):
+        proto, rest = url.split('://', 1)
+        if '/' in rest:
+            hostport, path = rest.split('/', 1)
+            path = '/' + path
+        else:
+            hostport, path = rest, '/'
+        if ':' in hostport:
+            host, port = hostport.split(':', 1)
+            port = int(port)
+        else:
+            host = hostport
+            port = 443 if proto == 'https' else 80
+        key = (host, port)
+
+        if isinstance(data, str):
+            data = data.encode()
+
+        for _ in range(2):
+            sock = self._conns.pop(key, None)
+            fresh = sock is None
+            try:
+                if sock is None:
+                    sock = self._connect(host, port, proto == 'https')
+                self._send(sock, method, host, path, headers, data)
+                return self._read_head(key, sock)
+            except Exception:
+                try:
+                    sock.close()
+                except Exception:
+                    pass
+                if fresh:
+                    raise
+                # Stale pooled socket: retry once on a fresh connection
+        raise OSError("request failed")
+
+    def _send(self, sock, method, host, path, headers, data):
+        lines = [
+            "%s %s HTTP/1.1" % (method, path),
+            "Host: %s" % host,
+            "Connection: keep-alive",
+        ]
+        if headers:
+            for k, v in headers.items():
+                lines.append("%s: %s" % (k, v))
+        if data:
+            lines.append("Content-Length: %d" % len(data))
+        req = ("\r\n".join(lines) + "\r\n\r\n").encode()
+        _sock_write(sock, req)
+        if data:
+            _sock_write(sock, data)
+
+    def _read_head(self, key, sock):
+        status_line = _sock_readline(sock)
+        if not status_line:
+            raise OSError("empty response")
+        status = int(status_line.split(None, 2)[1])
+        resp_headers = {}
+        while True:
+            line = _sock_readline(sock)
+            if not line or line in (b'\r\n', b'\n'):
+                break
+            k, _, v = line.decode().partition(':')
+            resp_headers[k.strip().lower()] = v.strip()
+        length = resp_headers.get('content-length')
+        length = int(length) if length is not None else None
+        chunked = 'chunked' in resp_headers.get('transfer-encoding', '').lower()
+        if status in (204, 304):
+            # Bodiless by spec even when Content-Length advertises the
+            # entity size (some servers do for 304), so frame as empty
+            length = 0
+            chunked = False
+        resp = _SessionResponse(self, key, sock, status, resp_headers, length, chunked)
+        if not self.keepalive:
+            resp._reusable = False
+        return resp
+
+    def get_pipelined(self, urls, headers_list, batch=4):
+        """Send GETs for same-host URLs back-to-back in batches on one
+        keep-alive connection and yield (index, response) in order.
+
+        The Pico W's single core spends most of a serial download run
+        waiting on TLS round trips; sending a batch of requests before
+        reading any reply hides that, so a batch costs roughly one RTT
+        instead of one per file. Mid-batch responses hand out their body
+        via .raw but not the socket itself; the generator drains whatever
+        the caller leaves unread so the next reply stays framed. A chunked
+        or close-delimited reply can't be safely framed mid-pipeline, so it
+        is given the socket and the remaining URLs start a fresh
+        connection."""
+        proto, rest = urls[0].split('://', 1)
+        hostport = rest.split('/', 1)[0]
+        if ':' in hostport:
+            host, port = hostport.split(':', 1)
+            port = int(port)
+        else:
+            host = hostport
+            port = 443 if proto == 'https' else 80
+        key = (host, port)
+        paths = []
+        for url in urls:
+            r = url.split('://', 1)[1]
+            paths.append('/' + r.split('/', 1)[1] if '/' in r else '/')
+
+        i = 0
+        n = len(urls)
+        while i < n:
+            j = min(i + batch, n)
+            sock = self._conns.pop(key, None)
+            if sock is None:
+                sock = self._connect(host, port, proto == 'https')
+            try:
+                for k in range(i, j):
+                    self._send(sock, 'GET', host, paths[k], headers_list[k], None)
+                k = i
+                while k < j:
+                    resp = self._read_head(key, sock)
+                    if resp._chunked or resp.raw is None or resp.raw.remaining is None:
+                        resp._reusable = False
+                        yield k, resp
+                        k += 1
+                        break
+                    if k < j - 1:
+                        resp._sock = None  # generator keeps the socket
+                    yield k, resp
+                    if k < j - 1:
+                        rem = resp.raw.remaining
+                        while rem > 0:
+                            chunk = _sock_read(sock, min(rem, 1024))
+                            if not chunk:
+                                raise OSError("short pipelined body")
+                            rem -= len(chunk)
+                    k += 1
+                i = k
+            except Exception:
+                try:
+                    sock.close()
+                except Exception:
+                    pass
+                raise
+
+    def close(self):
+        for sock in self._conns.values():
+            try:
+                sock.close()
+            except Exception:
+                pass
+        self._conns.clear()
+
 
 # Import PNG decoder
 try:
@@ -26,6 +466,11 @@ except ImportError:
     print("Please create SECRETS.py with your configuration.")
     print("See the SECRETS.py template for required variables.")
     raise
+except ValueError as e:
+    # Config validation failed: report the specific problem before the
+    # reset handler kicks in rather than booting into a broken state
+    print(f"ERROR: invalid configuration: {e}")
+    raise
 
 class PlaneTracker:
     def __init__(self):
@@ -47,26 +492,99 @@ class PlaneTracker:
         # Extra hues for route rendering
         self.DARK_ORANGE = self.graphics.create_pen(200, 100, 0)
         
-        # Commercial airline codes (major carriers only)
-        self.commercial_airlines = {
-            'BAW', 'VIR', 'EZY', 'RYR',  # UK carriers
-            'UAL', 'AAL', 'DAL', 'JBU',  # US carriers  
-            'AFR', 'DLH', 'KLM', 'IBE', 'SAS',  # European carriers
-            'UAE', 'ETD', 'QTR', 'SVA', 'THY',  # Middle East carriers
-            'SIA', 'CPA', 'JAL', 'ANA', 'QFA',  # Asia Pacific carriers
-            'ACA', 'WJA',  # Canadian carriers
-            'TAM', 'LAN',  # South American carriers
-        }
+        # Commercial airline codes (shared module-level frozenset)
+        self.commercial_airlines = COMMERCIAL_AIRLINES
+        # Stable iteration order for syncs without re-sorting a set each time
+        self._airline_codes_sorted = tuple(sorted(COMMERCIAL_AIRLINES))
+
+        # Keep-alive HTTP session shared by all API/logo fetches; avoids a
+        # fresh TCP+TLS handshake per request to the same host
+        try:
+            _read_to = HTTP_READ_TIMEOUT
+        except NameError:
+            _read_to = 10
+        try:
+            _conn_to = HTTP_CONNECT_TIMEOUT
+        except NameError:
+            _conn_to = 5
+        try:
+            _keep = HTTP_KEEPALIVE
+        except NameError:
+            _keep = True
+        self._session = HTTPSession(timeout=_read_to, connect_timeout=_conn_to,
+                                    keepalive=_keep)
         
         self.planes = []
         self.last_api_update = 0
         self.wifi_connected = False
         self.auth_token = None
         self.token_expires = 0
+        # Token endpoint/cache settings; optional in older SECRETS.py files
+        try:
+            self.TOKEN_URL = OPENSKY_TOKEN_URL
+        except NameError:
+            self.TOKEN_URL = "https://auth.opensky-network.org/auth/realms/opensky-network/protocol/openid-connect/token"
+        try:
+            self.TOKEN_REFRESH_SAFETY = OPENSKY_TOKEN_REFRESH_SAFETY
+        except NameError:
+            self.TOKEN_REFRESH_SAFETY = 60
+        try:
+            self.TOKEN_CACHE_PATH = OPENSKY_TOKEN_CACHE_PATH
+        except NameError:
+            self.TOKEN_CACHE_PATH = "/opensky_token.json"
+        self._load_cached_token()
         self.display_plane_index = 0
         self.last_plane_switch = 0
         self.fetching_data = False
         self.api_success = False
+
+        # Home coordinates pre-converted to radians/trig once; the per-plane
+        # distance math then only needs trig for the plane's own position
+        try:
+            # Newer SECRETS files precompute the home trig at import
+            self._home_lat_rad = HOME_LAT_RAD
+            self._home_lon_rad = HOME_LON_RAD
+            self._home_cos_lat = HOME_COS_LAT
+        except NameError:
+            self._home_lat_rad = math.radians(HOME_LAT)
+            self._home_lon_rad = math.radians(HOME_LON)
+            self._home_cos_lat = math.cos(self._home_lat_rad)
+        self._home_sin_lat = math.sin(self._home_lat_rad)
+
+        # The states URL and base headers never change for a fixed
+        # HOME_LAT/HOME_LON/SEARCH_RADIUS_KM, so build them once instead of
+        # redoing the trig and string interpolation on every fetch
+        try:
+            # Newer SECRETS files precompute the (padded) bbox at import
+            lamin, lomin, lamax, lomax = opensky_bbox()
+        except NameError:
+            lat_delta = SEARCH_RADIUS_KM / 111.0
+            lon_delta = SEARCH_RADIUS_KM / (111.0 * self._home_cos_lat)
+            lamin = HOME_LAT - lat_delta
+            lamax = HOME_LAT + lat_delta
+            lomin = HOME_LON - lon_delta
+            lomax = HOME_LON + lon_delta
+        self._api_url = f"https://opensky-network.org/api/states/all?lamin={lamin}&lamax={lamax}&lomin={lomin}&lomax={lomax}"
+        self._base_headers = {'User-Agent': 'GalacticUnicorn-PlaneTracker/1.0'}
+
+        # Squared radius (with a 5% margin for the flat-earth approximation)
+        # for the cheap equirectangular prefilter in fetch_planes; the exact
+        # haversine check still runs on survivors
+        try:
+            self._radius_sq = SEARCH_RADIUS_KM_SQ * 1.05 * 1.05
+        except NameError:
+            self._radius_sq = (SEARCH_RADIUS_KM * 1.05) ** 2
+
+        # Wall-clock time sampled once per main-loop iteration; hot paths
+        # read this instead of calling time.time() repeatedly per frame
+        self._now = time.time()
+        # 1-second result cache for _uk_localtime (BST math is expensive)
+        self._uk_lt_second = -1
+        self._uk_lt_cache = None
+        # BST bounds memo: _bst_bounds_epoch walks days via mktime (~14
+        # calls), so cache the result per year
+        self._bst_cache_year = None
+        self._bst_cache = (0, 0)
         
         # Logos sync scheduling
         self.last_logos_sync = 0
@@ -75,8 +593,49 @@ class PlaneTracker:
         except NameError:
             self.LOGOS_SYNC_INTERVAL = 3600  # default: 1 hour
         
-        # Cache of missing logos to avoid repeated logs
-        self._missing_logo_cache = set()
+        # Resolved logo paths and PNG dimensions per airline code; avoids
+        # os.stat and header reads on every frame (flash FS access is slow)
+        self._logo_path_cache = {}
+        self._png_dim_cache = {}
+
+        # Resolve the plane icon PNG once and precompute the fallback
+        # silhouette pixels so per-frame draws never probe the filesystem.
+        # Resolved before the logo scan below: _preload_logos reads it.
+        self._plane_png = None
+        for candidate in ("logos/plane.png", "plane.png"):
+            try:
+                os.stat(candidate)
+                self._plane_png = candidate
+                break
+            except Exception:
+                pass
+        self._plane_silhouette = tuple(
+            (i, j)
+            for i in range(11)
+            for j in range(11)
+            if (i == 5 and 2 <= j <= 8) or (j == 5 and 3 <= i <= 7)
+            or (i == 2 and j == 5) or (i == 8 and j == 5)
+        )
+
+        # Airline code -> (path, w, h) map built from one os.listdir walk at
+        # boot (and after each logo sync); draws then hit dict lookups only.
+        # Known-missing/bad files are tracked in the same dict as filename
+        # keys with a None sentinel (also suppresses repeated logs)
+        self._logo_paths = {}
+        self._logo_data_cache = {}
+        self._scan_logos()
+        self._preload_logos()
+
+        # Pre-decoded logo frames: resize_logos.py emits raw RGB565 bytes
+        # (plus an alpha bitmask) per logo; blitting those skips the PNG
+        # inflate entirely. Pens are cached per RGB565 value across logos.
+        try:
+            self.LOGO_RAW_DIR = LOGO_DECODED_CACHE_DIR
+        except NameError:
+            self.LOGO_RAW_DIR = "logos_raw"
+        self._pen_cache = {}
+        self._raw_logos = {}
+        self._scan_raw_logos()
 
         # Memory controls
         try:
@@ -106,9 +665,25 @@ class PlaneTracker:
         self.next_frame_key = None
         self.clock_only = False
         self.count_overlay_until = 0
+        self._current_font = None
+        self._tw_cache = {}
+        # Per-switch debounce state for edge-triggered button handling
+        self._btn_state = {}
+        self._btn_last_change = {}
+        # Frame-dirty tracking: update_display skips the redraw and DMA
+        # push when nothing on screen can have changed
+        self._last_state_key = None
+        self._display_epoch = 0
         self.last_cycle = None
         self.fetch_due_at = 0
 
+        # Cached clock strings/layout; rebuilt only when the minute changes
+        # so the clock frame doesn't allocate fresh strings every frame
+        self._clock_last_minute = -1
+        self._clock_date_str = ""
+        self._clock_time_str = ""
+        self._clock_draw_x = 0
+
         # Night mode (UK time): 00:00–08:00 show clock only and dim display
         try:
             self.NIGHT_START_HOUR = NIGHT_START_HOUR  # optional override via SECRETS
@@ -140,11 +715,40 @@ class PlaneTracker:
         self.ntp_last_sync = 0
         self.ntp_ok = False
 
-        # Logo sync preferences
+        # Logo cache TTLs; optional in older SECRETS.py files
+        try:
+            self.LOGO_NEG_TTL = LOGO_NEG_CACHE_TTL
+        except NameError:
+            self.LOGO_NEG_TTL = 86400
+        try:
+            self.LOGO_POS_TTL = LOGO_POS_CACHE_TTL
+        except NameError:
+            self.LOGO_POS_TTL = 604800
+        try:
+            self.LOGO_CACHE_MAX = LOGO_CACHE_MAX_ENTRIES
+        except NameError:
+            self.LOGO_CACHE_MAX = 256
+        # When each missing-logo sentinel was recorded, for TTL expiry
+        self._logo_missing_ts = {}
+        # Conditional-GET settings; optional in older SECRETS.py files
+        try:
+            self.GITHUB_CONDITIONAL = GITHUB_USE_CONDITIONAL_GET
+        except NameError:
+            self.GITHUB_CONDITIONAL = True
         try:
-            self.ALLOW_API_LOGO_LISTING = ALLOW_API_LOGO_LISTING
+            self.GITHUB_ETAG_PATH = GITHUB_ETAG_PATH
         except NameError:
-            self.ALLOW_API_LOGO_LISTING = False  # default: avoid large JSON listings
+            self.GITHUB_ETAG_PATH = "logos/_etags.json"
+        try:
+            self.LOGOS_MANIFEST_URL = GITHUB_LOGOS_MANIFEST_URL
+        except NameError:
+            self.LOGOS_MANIFEST_URL = None
+        try:
+            self.USE_LOGOS_MANIFEST = USE_LOGOS_MANIFEST
+        except NameError:
+            self.USE_LOGOS_MANIFEST = self.LOGOS_MANIFEST_URL is not None
+
+        # Logo sync preferences
         try:
             self.GITHUB_LOGOS_RAW_BASE = GITHUB_LOGOS_RAW_BASE
         except NameError:
@@ -156,6 +760,49 @@ class PlaneTracker:
         except Exception:
             self.API_INTERVAL = 10
 
+        # Display batching; constants optional in older SECRETS.py files
+        try:
+            self.DISPLAY_MIN_REDRAW = DISPLAY_MIN_REDRAW_INTERVAL
+        except NameError:
+            self.DISPLAY_MIN_REDRAW = DISPLAY_UPDATE_INTERVAL
+        try:
+            self.DISPLAY_IDLE_REDRAW = DISPLAY_IDLE_REDRAW_INTERVAL
+        except NameError:
+            self.DISPLAY_IDLE_REDRAW = 1.0
+        try:
+            self.DISPLAY_BATCH_DIRTY = DISPLAY_BATCH_DIRTY
+        except NameError:
+            self.DISPLAY_BATCH_DIRTY = True
+
+        # First-poll jitter spreads fleet boots across the interval;
+        # optional in older SECRETS.py files
+        try:
+            jitter = UPDATE_JITTER_SECONDS
+        except NameError:
+            jitter = 0
+        self._first_poll_offset = 0
+        if jitter and random is not None:
+            try:
+                self._first_poll_offset = random.uniform(0, jitter)
+            except AttributeError:
+                self._first_poll_offset = (random.getrandbits(16) / 65536.0) * jitter
+
+        # Early on-ground drop; derived in newer SECRETS files
+        try:
+            self.FILTER_ONGROUND = OPENSKY_FILTER_ONGROUND
+        except NameError:
+            self.FILTER_ONGROUND = not SHOW_GROUND_AIRCRAFT
+
+        # Exponential backoff state for 429 responses; constants are
+        # optional in older SECRETS.py files
+        try:
+            self.BACKOFF_ON_429 = API_BACKOFF_ON_429
+            self.BACKOFF_MAX = API_BACKOFF_MAX
+        except NameError:
+            self.BACKOFF_ON_429 = 60
+            self.BACKOFF_MAX = 600
+        self._consecutive_429 = 0
+
         # Route (ADSBdb) cache
         self.route_cache = {}
         self.callsign_iata_cache = {}
@@ -166,108 +813,149 @@ class PlaneTracker:
             self.ROUTE_TTL = 1800  # 30 minutes
         self.last_route_fetch_time = 0
 
-        # Route (ADSBdb) cache
-        self.route_cache = {}
+        # Route lookups found missing during render are queued here and
+        # drained one per main-loop tick, so a TLS handshake to adsbdb never
+        # blocks the display path
+        self._route_queue = []
+        # Reused scratch sets for merge_display_queue
+        self._merge_seen = set()
+        self._merge_existing = set()
+
+        # Persist caches to flash so reboots don't trigger a burst of
+        # network fetches (route TTL usually outlives short power blips)
         try:
-            self.ROUTE_TTL = ROUTE_TTL
+            self.CACHE_FILE = CACHE_FILE
         except NameError:
-            self.ROUTE_TTL = 1800  # 30 minutes
-        self.last_route_fetch_time = 0
+            self.CACHE_FILE = "cache.json"
+        self._caches_dirty = False
+        self._caches_last_save = 0
+        self.load_caches()
+
+        # Tiny 3x5 font (shared module-level dict; see _TINY_FONT)
+        self._tiny_font = _TINY_FONT
+
+        # Precompute horizontal spans of lit pixels per glyph as (dx, dy,
+        # length) triples, indexed by ord(ch) (None = no glyph) so the draw
+        # loops use raw array indexing instead of dict hashing. Contiguous
+        # runs (e.g. a 0b111 row) are drawn with a single pixel_span call
+        # instead of three pixel calls. Source rows come from the packed
+        # module-level _FONT_ROWS buffer
+        spans_by_ord = [None] * 128
+        for o in range(128):
+            if not _FONT_HAS[o]:
+                continue
+            spans = []
+            base = o * 5
+            for row in range(5):
+                bits = _FONT_ROWS[base + row]
+                col = 0
+                while col < 3:
+                    if bits & _BITS[col]:
+                        start = col
+                        while col < 3 and bits & _BITS[col]:
+                            col += 1
+                        spans.append((start, row, col - start))
+                    else:
+                        col += 1
+            spans_by_ord[o] = tuple(spans)
+        self._glyph_spans = tuple(spans_by_ord)
+        # pixel_span is missing on some older firmware; fall back to pixel
+        self._pixel_span = getattr(self.graphics, 'pixel_span', None)
 
-        # Tiny 3x5 font for compact text (date/time/route)
-        self._tiny_font = {
-            '0': [0b111, 0b101, 0b101, 0b101, 0b111],
-            '1': [0b010, 0b110, 0b010, 0b010, 0b111],
-            '2': [0b111, 0b001, 0b111, 0b100, 0b111],
-            '3': [0b111, 0b001, 0b111, 0b001, 0b111],
-            '4': [0b101, 0b101, 0b111, 0b001, 0b001],
-            '5': [0b111, 0b100, 0b111, 0b001, 0b111],
-            '6': [0b111, 0b100, 0b111, 0b101, 0b111],
-            '7': [0b111, 0b001, 0b010, 0b100, 0b100],
-            '8': [0b111, 0b101, 0b111, 0b101, 0b111],
-            '9': [0b111, 0b101, 0b111, 0b001, 0b111],
-            '/': [0b001, 0b001, 0b010, 0b100, 0b100],
-            ':': [0b000, 0b010, 0b000, 0b010, 0b000],
-            '-': [0b000, 0b000, 0b111, 0b000, 0b000],
-            '>': [0b100, 0b010, 0b001, 0b010, 0b100],
-            'A': [0b010, 0b101, 0b111, 0b101, 0b101],
-            'B': [0b110, 0b101, 0b110, 0b101, 0b110],
-            'C': [0b011, 0b100, 0b100, 0b100, 0b011],
-            'D': [0b110, 0b101, 0b101, 0b101, 0b110],
-            'E': [0b111, 0b100, 0b110, 0b100, 0b111],
-            'F': [0b111, 0b100, 0b110, 0b100, 0b100],
-            'G': [0b011, 0b100, 0b101, 0b101, 0b011],
-            'H': [0b101, 0b101, 0b111, 0b101, 0b101],
-            'I': [0b111, 0b010, 0b010, 0b010, 0b111],
-            'J': [0b001, 0b001, 0b001, 0b101, 0b010],
-            'K': [0b101, 0b110, 0b100, 0b110, 0b101],
-            'L': [0b100, 0b100, 0b100, 0b100, 0b111],
-            'M': [0b101, 0b111, 0b111, 0b101, 0b101],
-            'N': [0b101, 0b111, 0b111, 0b111, 0b101],
-            'O': [0b111, 0b101, 0b101, 0b101, 0b111],
-            'P': [0b111, 0b101, 0b111, 0b100, 0b100],
-            'Q': [0b111, 0b101, 0b101, 0b111, 0b001],
-            'R': [0b111, 0b101, 0b111, 0b110, 0b101],
-            'S': [0b011, 0b100, 0b011, 0b001, 0b110],
-            'T': [0b111, 0b010, 0b010, 0b010, 0b010],
-            'U': [0b101, 0b101, 0b101, 0b101, 0b111],
-            'V': [0b101, 0b101, 0b101, 0b101, 0b010],
-            'W': [0b101, 0b101, 0b111, 0b111, 0b101],
-            'X': [0b101, 0b101, 0b010, 0b101, 0b101],
-            'Y': [0b101, 0b101, 0b010, 0b010, 0b010],
-            'Z': [0b111, 0b001, 0b010, 0b100, 0b111],
-        }
-        
     def tiny_text_width(self, s):
         n = len(s)
         if n <= 0:
             return 0
         return n * 3 + (n - 1)
 
+    @_native
+    def _draw_glyph_spans(self, glyph, cx, y):
+        """Blit one glyph's precomputed spans at (cx, y)."""
+        span = self._pixel_span
+        if span:
+            for dx, dy, ln in glyph:
+                span(cx + dx, y + dy, ln)
+        else:
+            pixel = self.graphics.pixel
+            for dx, dy, ln in glyph:
+                for i in range(ln):
+                    pixel(cx + dx + i, y + dy)
+
+    @_native
     def draw_tiny_text(self, s, x, y, pen):
         self.graphics.set_pen(pen)
+        spans = self._glyph_spans
+        blit = self._draw_glyph_spans
         cx = x
         for ch in s:
-            glyph = self._tiny_font.get(ch)
+            o = ord(ch)
+            glyph = spans[o] if o < 128 else None
             if glyph is None:
                 cx += 4
                 continue
-            for row in range(5):
-                bits = glyph[row]
-                for col in range(3):
-                    if (bits & (1 << (2 - col))) != 0:
-                        self.graphics.pixel(cx + col, y + row)
+            blit(glyph, cx, y)
             cx += 4
 
     def draw_route_tiny(self, route_str, x, y, code_pen, arrow_pen):
         """Draw route like ABC->DEF with different color for arrow."""
         if not route_str:
             return
+        spans = self._glyph_spans
+        blit = self._draw_glyph_spans
+        # Classify characters by pen first, then draw one pen group at a
+        # time so set_pen is called at most twice instead of per character
+        # (arrow chars are '-' and '>')
+        code_chars = []
+        arrow_chars = []
         cx = x
         for ch in route_str:
-            glyph = self._tiny_font.get(ch)
-            # Choose pen: arrow chars '-' and '>'
-            if ch in ('-', '>'):
-                self.graphics.set_pen(arrow_pen)
-            else:
-                self.graphics.set_pen(code_pen)
-            if glyph is None:
-                cx += 4
-                continue
-            for row in range(5):
-                bits = glyph[row]
-                for col in range(3):
-                    if (bits & (1 << (2 - col))) != 0:
-                        self.graphics.pixel(cx + col, y + row)
+            o = ord(ch)
+            glyph = spans[o] if o < 128 else None
+            if glyph is not None:
+                if ch in ('-', '>'):
+                    arrow_chars.append((glyph, cx))
+                else:
+                    code_chars.append((glyph, cx))
             cx += 4
+        set_pen = self.graphics.set_pen
+        if code_chars:
+            set_pen(code_pen)
+            for glyph, gx in code_chars:
+                blit(glyph, gx, y)
+        if arrow_chars:
+            set_pen(arrow_pen)
+            for glyph, gx in arrow_chars:
+                blit(glyph, gx, y)
+
+    def _http_get(self, url, headers=None):
+        """GET via the keep-alive session; falls back to a one-shot
+        urequests call if the session can't complete the request."""
+        try:
+            return self._session.request('GET', url, headers=headers)
+        except Exception:
+            pass
+        headers = headers or {}
+        try:
+            return urequests.get(url, headers=headers, timeout=10)
+        except TypeError:
+            return urequests.get(url, headers=headers)
+
+    def _http_post(self, url, headers=None, data=None):
+        """POST via the keep-alive session with urequests fallback."""
+        try:
+            return self._session.request('POST', url, headers=headers, data=data)
+        except Exception:
+            pass
+        headers = headers or {}
+        return urequests.post(url, headers=headers, data=data)
 
     def _norm_callsign(self, callsign):
         try:
-            return (callsign or "").strip().upper()
+            return _intern((callsign or "").strip().upper())
         except Exception:
             return callsign or ""
 
-    def get_cached_route(self, callsign):
+    def get_cached_route(self, callsign, now=None):
         callsign = self._norm_callsign(callsign)
         if not callsign:
             return None
@@ -275,24 +963,24 @@ class PlaneTracker:
         if not item:
             return None
         route_str, ts = item
-        if time.time() - ts > self.ROUTE_TTL:
+        if now is None:
+            now = self._now
+        if now - ts > self.ROUTE_TTL:
             return None
         return route_str
 
-    def fetch_route(self, callsign):
+    def fetch_route(self, callsign, now=None):
         # Throttle lookups per callsign
         callsign = self._norm_callsign(callsign)
-        now = time.time()
+        if now is None:
+            now = self._now
         last = self.route_last_fetch_times.get(callsign, 0)
         if now - last < 5:
             return self.route_cache.get(callsign, (None, 0))[0]
         self.route_last_fetch_times[callsign] = now
         try:
             url = f"https://api.adsbdb.com/v0/callsign/{callsign.lower()}"
-            try:
-                r = urequests.get(url, timeout=5)
-            except TypeError:
-                r = urequests.get(url)
+            r = self._http_get(url)
             if r.status_code == 200:
                 data = r.json()
                 r.close()
@@ -305,10 +993,12 @@ class PlaneTracker:
                 if o and d:
                     route_str = f"{o}>{d}"
                     self.route_cache[callsign] = (route_str, now)
+                    self._caches_dirty = True
                 # Cache IATA callsign if present (inside flightroute)
                 iata_cs = (fr.get('callsign_iata') or '').upper()
                 if iata_cs:
                     self.callsign_iata_cache[callsign] = (iata_cs, now)
+                    self._caches_dirty = True
                 return self.route_cache.get(callsign, (None, 0))[0]
             else:
                 r.close()
@@ -320,28 +1010,101 @@ class PlaneTracker:
         route = self.get_cached_route(callsign)
         if route is not None:
             return route
-        return self.fetch_route(callsign)
+        # Defer the network lookup to the main loop so the render path never
+        # blocks on a TLS handshake
+        self.queue_route_fetch(callsign)
+        return None
+
+    def queue_route_fetch(self, callsign):
+        callsign = self._norm_callsign(callsign)
+        if callsign and callsign not in self._route_queue:
+            self._route_queue.append(callsign)
+
+    def process_route_queue(self):
+        """Fetch at most one queued route per main-loop tick. Skipped while a
+        states request is in flight to avoid competing for the socket."""
+        if self.fetching_data or not self._route_queue:
+            return
+        callsign = self._route_queue.pop(0)
+        try:
+            before = (self.route_cache.get(callsign),
+                      self.callsign_iata_cache.get(callsign))
+            self.fetch_route(callsign, self._now)
+            # Only dirty the frame when the lookup actually produced
+            # something new; a throttled or empty result would otherwise
+            # force a redraw every tick for planes with no known route
+            if (self.route_cache.get(callsign),
+                    self.callsign_iata_cache.get(callsign)) != before:
+                self._display_epoch += 1
+        except Exception:
+            pass
+
+    def load_caches(self):
+        """Hydrate route/IATA/missing-logo caches from flash, dropping
+        expired route entries."""
+        try:
+            with open(self.CACHE_FILE) as f:
+                data = json.load(f)
+        except Exception:
+            return
+        try:
+            now = time.time()
+            for cs, item in data.get('routes', {}).items():
+                route_str, ts = item
+                if now - ts <= self.ROUTE_TTL:
+                    self.route_cache[cs] = (route_str, ts)
+            for cs, item in data.get('iata', {}).items():
+                iata_cs, ts = item
+                if now - ts <= self.ROUTE_TTL:
+                    self.callsign_iata_cache[cs] = (iata_cs, ts)
+            missing = data.get('missing_logos', [])
+            if isinstance(missing, dict):
+                for name, ts in missing.items():
+                    if now - ts < self.LOGO_NEG_TTL:
+                        self._logo_paths[name] = None
+                        self._logo_missing_ts[name] = ts
+            else:
+                # Legacy list form (no timestamps): treat as fresh
+                for name in missing:
+                    self._logo_paths[name] = None
+                    self._logo_missing_ts[name] = now
+        except Exception:
+            pass
+
+    def save_caches(self):
+        try:
+            now = time.time()
+            # Persist from the timestamp map, not the _logo_paths
+            # sentinels: _scan_logos rebuilds those from scratch after
+            # every sync, which would empty the negative cache on disk
+            missing = {k: ts for k, ts in self._logo_missing_ts.items()
+                       if now - ts < self.LOGO_NEG_TTL}
+            if len(missing) > self.LOGO_CACHE_MAX:
+                # Evict oldest entries beyond the cap
+                keep = sorted(missing.items(), key=lambda kv: kv[1])
+                missing = dict(keep[-self.LOGO_CACHE_MAX:])
+            with open(self.CACHE_FILE, 'w') as f:
+                json.dump({'routes': self.route_cache,
+                           'iata': self.callsign_iata_cache,
+                           'missing_logos': missing}, f)
+            self._caches_dirty = False
+            self._caches_last_save = time.time()
+        except Exception:
+            pass
 
     def get_display_callsign(self, callsign):
         # Prefer IATA callsign if recently cached; fall back to ICAO callsign
         if not callsign:
             return ""
         norm = self._norm_callsign(callsign)
+        now = self._now
         item = self.callsign_iata_cache.get(norm)
         if item:
             cs, ts = item
-            if time.time() - ts <= self.ROUTE_TTL and cs:
-                return cs
-        # Try to fetch once to populate cache (throttled in fetch_route)
-        try:
-            self.fetch_route(norm)
-        except Exception:
-            pass
-        item = self.callsign_iata_cache.get(norm)
-        if item:
-            cs, ts = item
-            if time.time() - ts <= self.ROUTE_TTL and cs:
+            if now - ts <= self.ROUTE_TTL and cs:
                 return cs
+        # Queue a lookup to populate the cache; fall back to ICAO until then
+        self.queue_route_fetch(norm)
         return norm
         
     def draw_png(self, filename, x, y):
@@ -351,7 +1114,6 @@ class PlaneTracker:
                 # Use the correct PicoGraphics PNG method
                 self.png.open_file(filename)
                 self.png.decode(x, y)
-                gc.collect()
                 return True
             except Exception as e:
                 print(f"Failed to draw PNG {filename}: {e}")
@@ -400,13 +1162,18 @@ class PlaneTracker:
         return 31
 
     def _bst_bounds_epoch(self, year):
-        """Compute BST start/end epochs for a given year (UTC)."""
+        """Compute BST start/end epochs for a given year (UTC). Memoized per
+        year so the mktime walk only runs once after boot (or at new year)."""
+        if year == self._bst_cache_year:
+            return self._bst_cache
         try:
             start_day = self._last_sunday(year, 3)
             end_day = self._last_sunday(year, 10)
             # BST: from last Sunday in March 01:00 UTC to last Sunday in October 01:00 UTC
             start_epoch = time.mktime((year, 3, start_day, 1, 0, 0, 0, 0))
             end_epoch = time.mktime((year, 10, end_day, 1, 0, 0, 0, 0))
+            self._bst_cache_year = year
+            self._bst_cache = (start_epoch, end_epoch)
             return start_epoch, end_epoch
         except Exception:
             return 0, 0
@@ -414,7 +1181,11 @@ class PlaneTracker:
     def _uk_localtime(self):
         """Return UK local time tuple from RTC (assumed UTC).
         Applies BST between last Sun Mar 01:00 and last Sun Oct 01:00.
+        Result is cached for the current second to keep the render loop cheap.
         """
+        now_s = int(self._now)
+        if now_s == self._uk_lt_second and self._uk_lt_cache is not None:
+            return self._uk_lt_cache
         tm_utc = time.localtime()
         year = tm_utc[0]
         try:
@@ -425,21 +1196,29 @@ class PlaneTracker:
         start_epoch, end_epoch = self._bst_bounds_epoch(year)
         offset = 3600 if (start_epoch and end_epoch and start_epoch <= epoch < end_epoch) else 0
         try:
-            return time.localtime(epoch + offset)
+            result = time.localtime(epoch + offset)
         except Exception:
-            return tm_utc
+            result = tm_utc
+        self._uk_lt_second = now_s
+        self._uk_lt_cache = result
+        return result
     def get_png_dimensions(self, filename):
-        """Read PNG IHDR to get width,height without decoding whole image."""
+        """Read PNG IHDR to get width,height without decoding whole image.
+        Results are cached per filename so repeat draws skip the file read."""
+        if filename in self._png_dim_cache:
+            return self._png_dim_cache[filename]
         try:
             with open(filename, 'rb') as f:
                 header = f.read(24)
                 # PNG signature is 8 bytes; IHDR chunk follows with 4B len, 4B type, then width,height
                 if len(header) >= 24 and header[:8] == b'\x89PNG\r\n\x1a\n' and header[12:16] == b'IHDR':
-                    w = int.from_bytes(header[16:20], 'big')
-                    h = int.from_bytes(header[20:24], 'big')
+                    # One C call instead of two int.from_bytes round-trips
+                    w, h = struct.unpack('>II', header[16:24])
+                    self._png_dim_cache[filename] = (w, h)
                     return w, h
         except Exception as e:
             print(f"Could not read PNG dimensions for {filename}: {e}")
+        self._png_dim_cache[filename] = (None, None)
         return None, None
 
     def _clear_clip_safe(self):
@@ -455,20 +1234,51 @@ class PlaneTracker:
         except Exception:
             pass
 
+    def _preload_logos(self):
+        """Read the 11x11 logo PNGs (and the plane icon) into RAM once so
+        per-frame draws decode from memory instead of flash. Each file is a
+        few hundred bytes, so the whole airline set costs ~10-15 KB."""
+        cache = {}
+        for entry in self._logo_paths.values():
+            if not entry or not isinstance(entry, tuple):
+                continue
+            path = entry[0]
+            try:
+                with open(path, 'rb') as f:
+                    cache[path] = f.read()
+            except Exception:
+                pass
+        if self._plane_png and self._plane_png not in cache:
+            try:
+                with open(self._plane_png, 'rb') as f:
+                    cache[self._plane_png] = f.read()
+            except Exception:
+                pass
+        self._logo_data_cache = cache
+
     def draw_png_fitted_11(self, filename, x, y):
         """Draw a PNG fitted into an 11x11 box at (x,y): center, crop, or integer upscale if possible."""
         if not (self.png and PNG_AVAILABLE):
             return False
         if not filename:
             return False
+        # Known-bad file (None sentinel in the logo map): skip the open
+        if self._logo_paths.get(filename, 0) is None:
+            return False
         src_w, src_h = self.get_png_dimensions(filename)
+        data = self._logo_data_cache.get(filename)
         try:
-            self.png.open_file(filename)
+            if data is not None:
+                try:
+                    self.png.open_RAM(data)
+                except AttributeError:
+                    self.png.open_file(filename)
+            else:
+                self.png.open_file(filename)
         except Exception as e:
             # Log only once per missing/bad file
-            if filename not in self._missing_logo_cache:
-                print(f"Missing/invalid PNG: {filename}")
-                self._missing_logo_cache.add(filename)
+            print(f"Missing/invalid PNG: {filename}")
+            self._logo_paths[filename] = None
             return False
 
         # Default target box
@@ -507,12 +1317,11 @@ class PlaneTracker:
                     self.png.decode(draw_x, draw_y)
             else:
                 self.png.decode(draw_x, draw_y)
-            gc.collect()
             return True
         except Exception as e:
-            if filename not in self._missing_logo_cache:
+            if self._logo_paths.get(filename, 0) is not None:
                 print(f"PNG decode failed: {filename}")
-                self._missing_logo_cache.add(filename)
+                self._logo_paths[filename] = None
             return False
         finally:
             if did_clip:
@@ -520,34 +1329,102 @@ class PlaneTracker:
 
     def draw_plane_symbol(self, x, y):
         """Draw plane icon from PNG if available, else a simple silhouette."""
-        if self.draw_png_fitted_11("logos/plane.png", x, y):
-            return True
-        if self.draw_png_fitted_11("plane.png", x, y):
-            return True
-        # Fallback silhouette
-            self.graphics.set_pen(self.WHITE)
-            for i in range(11):
-                for j in range(11):
-                    if (i == 5 and 2 <= j <= 8) or (j == 5 and 3 <= i <= 7) or (i == 2 and j == 5) or (i == 8 and j == 5):
-                        self.graphics.pixel(x + i, y + j)
+        if self._plane_png:
+            if self.draw_png_fitted_11(self._plane_png, x, y):
+                return True
+            # Bad/corrupt file: stop probing it every frame
+            self._plane_png = None
+        # Fallback silhouette (precomputed lit pixels)
+        self.graphics.set_pen(self.WHITE)
+        pixel = self.graphics.pixel
+        for dx, dy in self._plane_silhouette:
+            pixel(x + dx, y + dy)
         return True
     
+    def _scan_logos(self):
+        """Walk logos/ once and map airline code -> (path, w, h). Run at
+        boot and after each logo sync so the render path never stats the
+        filesystem per frame."""
+        paths = {}
+        try:
+            entries = set(os.listdir('logos'))
+        except Exception:
+            entries = set()
+        for code in self.commercial_airlines:
+            fn = code + '.png'
+            if fn in entries:
+                path = 'logos/' + fn
+                w, h = self.get_png_dimensions(path)
+                paths[code] = (path, w, h)
+        self._logo_paths = paths
+
+    def _scan_raw_logos(self):
+        """Load any pre-decoded 11x11 frames from LOGO_RAW_DIR into RAM.
+        Each file is exactly 258 bytes: 121 big-endian RGB565 pixels plus
+        a 16-byte alpha bitmask, so the whole set is a few KB."""
+        raw = {}
+        try:
+            entries = os.listdir(self.LOGO_RAW_DIR)
+        except Exception:
+            entries = []
+        for fn in entries:
+            if not fn.endswith('.rgb565'):
+                continue
+            try:
+                with open(self.LOGO_RAW_DIR + '/' + fn, 'rb') as f:
+                    buf = f.read()
+                if len(buf) == 258:
+                    raw[fn[:-7]] = buf
+            except Exception:
+                pass
+        self._raw_logos = raw
+
+    def _draw_rgb565_11(self, buf, x, y):
+        """Blit a pre-decoded 11x11 RGB565 frame at (x,y), skipping pixels
+        whose alpha bitmask bit is clear. No decode step: just pen lookups
+        and pixel writes."""
+        create_pen = self.graphics.create_pen
+        set_pen = self.graphics.set_pen
+        pixel = self.graphics.pixel
+        pens = self._pen_cache
+        for bit in range(121):
+            if not (buf[242 + (bit >> 3)] >> (bit & 7)) & 1:
+                continue
+            v = (buf[2 * bit] << 8) | buf[2 * bit + 1]
+            pen = pens.get(v)
+            if pen is None:
+                pen = create_pen((v >> 11) << 3, ((v >> 5) & 0x3F) << 2,
+                                 (v & 0x1F) << 3)
+                pens[v] = pen
+            set_pen(pen)
+            pixel(x + bit % 11, y + bit // 11)
+        return True
+
     def get_airline_png_filename(self, airline_code):
         """Get PNG filename for airline code"""
         # Return filename based on airline code
         # Files should be named like: BAW.png, VIR.png, etc.
         # Prefer logos/ subfolder if present
+        # The scanned logo map answers known airlines without any stat;
+        # other lookups fall back to (cached) os.stat probes
+        hit = self._logo_paths.get(airline_code)
+        if hit:
+            return hit[0]
+        if airline_code in self._logo_path_cache:
+            return self._logo_path_cache[airline_code]
         candidate = f"logos/{airline_code}.png"
         try:
             os.stat(candidate)
-            return candidate
+            result = candidate
         except Exception:
             root_candidate = f"{airline_code}.png"
             try:
                 os.stat(root_candidate)
-                return root_candidate
+                result = root_candidate
             except Exception:
-                return None
+                result = None
+        self._logo_path_cache[airline_code] = result
+        return result
     
     # Removed old color-block fallback methods; we now use plane symbol when a logo is missing
     
@@ -556,43 +1433,73 @@ class PlaneTracker:
         # Draw plane icon (fitted 11x11) using logo or silhouette fallback
         self.draw_plane_symbol(0, 0)
 
-        # Use UK local time (UTC with BST adjustment)
+        # Use UK local time (UTC with BST adjustment). The formatted strings
+        # and layout only change once a minute, so cache them between frames
         current_time = self._uk_localtime()
-        date_str = f"{current_time[2]:02d}/{current_time[1]:02d}"
-        time_str = f"{current_time[3]:02d}:{current_time[4]:02d}"
-        
-        # Render tiny text (3x5) centered in right-hand area
-        left_x = 13
-        avail_w = max(0, self.width - left_x)
+        minute_key = (current_time[2], current_time[3], current_time[4])
+        if minute_key != self._clock_last_minute:
+            self._clock_date_str = f"{current_time[2]:02d}/{current_time[1]:02d}"
+            self._clock_time_str = f"{current_time[3]:02d}:{current_time[4]:02d}"
 
-        date_w = self.tiny_text_width(date_str)
-        time_w = self.tiny_text_width(time_str)
-        block_w = max(date_w, time_w)
-        draw_x = left_x + max(0, (avail_w - block_w) // 2)
+            # Render tiny text (3x5) centered in right-hand area
+            left_x = 13
+            avail_w = max(0, self.width - left_x)
+            date_w = self.tiny_text_width(self._clock_date_str)
+            time_w = self.tiny_text_width(self._clock_time_str)
+            block_w = max(date_w, time_w)
+            self._clock_draw_x = left_x + max(0, (avail_w - block_w) // 2)
+            self._clock_last_minute = minute_key
 
         # Date on first line (y=0), time on second line (y=6 to create 1px gap)
-        self.draw_tiny_text(date_str, draw_x, 0, self.LIGHTBLUE)
-        self.draw_tiny_text(time_str, draw_x, 6, self.YELLOW)
+        self.draw_tiny_text(self._clock_date_str, self._clock_draw_x, 0, self.LIGHTBLUE)
+        self.draw_tiny_text(self._clock_time_str, self._clock_draw_x, 6, self.YELLOW)
     
     def draw_corner_indicators(self, color):
         """Draw LEDs in corners to show system status"""
         self.graphics.set_pen(color)
+        pixel = self.graphics.pixel
         # Draw in actual corners
-        self.graphics.pixel(0, 0)                          # Top-left
-        self.graphics.pixel(self.width - 1, 0)             # Top-right
-        self.graphics.pixel(0, self.height - 1)            # Bottom-left
-        self.graphics.pixel(self.width - 1, self.height - 1)  # Bottom-right
+        pixel(0, 0)                          # Top-left
+        pixel(self.width - 1, 0)             # Top-right
+        pixel(0, self.height - 1)            # Bottom-left
+        pixel(self.width - 1, self.height - 1)  # Bottom-right
     
+    def _tw(self, text, scale=1):
+        """measure_text width cached per (text, scale). The render loop
+        measures the same short strings (callsigns, airport codes, fixed
+        messages) every frame; cap the cache and dump it on overflow.
+        All text drawing uses bitmap6, so misses pin that font before
+        measuring - otherwise widths measured outside the render path
+        (e.g. route precompute during a fetch) would be taken under the
+        boot default font and cached wrong forever."""
+        key = (text, scale)
+        w = self._tw_cache.get(key)
+        if w is None:
+            if len(self._tw_cache) >= 128:
+                self._tw_cache.clear()
+            self._use_font("bitmap6")
+            w = int(self.graphics.measure_text(text, scale=scale))
+            self._tw_cache[key] = w
+        return w
+
+    def _use_font(self, name):
+        """Switch the PicoGraphics font only when it actually changes;
+        set_font does real internal work and these calls run per frame."""
+        if self._current_font == name:
+            return
+        try:
+            self.graphics.set_font(name)
+            self._current_font = name
+        except Exception:
+            pass
+
     def draw_text_no_scroll(self, text, x, y, color):
         """Draw text without scrolling, truncate if too long"""
         self.graphics.set_pen(color)
         
-        # Try to use smallest available font
-        try:
-            self.graphics.set_font("bitmap6")
-        except:
-            pass
-            
+        # Use smallest available font
+        self._use_font("bitmap6")
+
         # Truncate text to fit without scrolling
         max_chars = (self.width - x) // 4  # Rough estimate
         if len(text) > max_chars:
@@ -605,10 +1512,12 @@ class PlaneTracker:
         # Ensure no clipping interferes with text
         self._clear_clip_safe()
         # Use small bitmap font if available
-        try:
-            self.graphics.set_font("bitmap6")
-        except:
-            pass
+        g = self.graphics
+        self._use_font("bitmap6")
+        # Locals to skip repeated attribute lookups in fit_text below
+        measure = self._tw
+        text = g.text
+        set_pen = g.set_pen
 
         max_w = max(0, self.width - x)
         if max_w <= 0:
@@ -625,13 +1534,13 @@ class PlaneTracker:
             if not s or limit_w <= 0:
                 return "", 0
             # Fast path: fits as-is
-            w = int(self.graphics.measure_text(s, scale=1))
+            w = int(measure(s, scale=1))
             if w <= limit_w:
                 return s, w
             # Trim until it fits
             while s:
                 s = s[:-1]
-                w = int(self.graphics.measure_text(s, scale=1))
+                w = int(measure(s, scale=1))
                 if w <= limit_w:
                     return s, w
             return "", 0
@@ -639,24 +1548,25 @@ class PlaneTracker:
         # Fit and draw code
         code_draw, code_w = fit_text(code, max_w)
         if code_draw:
-            self.graphics.set_pen(code_color)
-            self.graphics.text(code_draw, x, y, scale=1)
+            set_pen(code_color)
+            text(code_draw, x, y, scale=1)
 
         # Fit and draw suffix right after code
         rem_w = max(0, max_w - code_w)
         if rem_w > 0 and suffix:
             suffix_draw, _ = fit_text(suffix, rem_w)
             if suffix_draw:
-                self.graphics.set_pen(suffix_color)
-                self.graphics.text(suffix_draw, x + code_w, y, scale=1)
+                set_pen(suffix_color)
+                text(suffix_draw, x + code_w, y, scale=1)
 
     def draw_callsign_two_tone_at_offset(self, callsign, y_offset):
         # Helper for animation: draws at vertical offset, keeping x fixed
         callsign = callsign or ""
         self.draw_callsign_two_tone(callsign, 13, 2 + y_offset, self.WHITE, self.LIGHTBLUE)
 
-    def draw_logo_for_callsign(self, callsign):
-        code = (callsign[:3] if callsign else "").upper()
+    def draw_logo_for_callsign(self, callsign, code=None):
+        if code is None:
+            code = (callsign[:3] if callsign else "").upper()
         self.draw_airline_icon(0, 0, code)
         
     def connect_wifi(self):
@@ -690,17 +1600,25 @@ class PlaneTracker:
     
     def haversine_distance(self, lat1, lon1, lat2, lon2):
         """Calculate distance between two points on Earth using Haversine formula"""
+        lat1_rad = math.radians(self._to_float(lat1))
+        lon1_rad = math.radians(self._to_float(lon1))
+        lat2_rad = math.radians(self._to_float(lat2))
+        lon2_rad = math.radians(self._to_float(lon2))
+        return self._haversine_rad(math.cos(lat1_rad), lat1_rad, lon1_rad,
+                                   math.cos(lat2_rad), lat2_rad, lon2_rad)
+
+    def _haversine_rad(self, cos_lat1, lat1_rad, lon1_rad,
+                       cos_lat2, lat2_rad, lon2_rad):
+        """Haversine on pre-converted radian/cosine values (no radians() or
+        repeated trig per call). Used in the API ingest loop with the home
+        values precomputed in __init__."""
         R = 6371  # Earth's radius in km
-        lat1 = self._to_float(lat1)
-        lon1 = self._to_float(lon1)
-        lat2 = self._to_float(lat2)
-        lon2 = self._to_float(lon2)
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-        a = (math.sin(dlat/2) * math.sin(dlat/2) + 
-             math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * 
-             math.sin(dlon/2) * math.sin(dlon/2))
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+        sin_dlat = math.sin((lat2_rad - lat1_rad) / 2)
+        sin_dlon = math.sin((lon2_rad - lon1_rad) / 2)
+        a = sin_dlat * sin_dlat + cos_lat1 * cos_lat2 * sin_dlon * sin_dlon
+        # asin form needs one sqrt instead of two plus atan2; clamp guards
+        # against a nudging past 1.0 from float rounding
+        c = 2 * math.asin(math.sqrt(a) if a < 1 else 1.0)
         return R * c
     
     def get_bearing(self, lat1, lon1, lat2, lon2):
@@ -727,9 +1645,10 @@ class PlaneTracker:
         # Must have a callsign
         if not callsign or callsign == 'Unknown':
             return False
-            
-        # Check if it's a known commercial airline
-        airline_code = callsign[:3].upper()
+
+        # Check if it's a known commercial airline (prefer the code cached
+        # at ingest to avoid re-slicing/upper-casing the callsign)
+        airline_code = plane.get('_airline') or callsign[:3].upper()
         if airline_code not in self.commercial_airlines:
             return False
             
@@ -748,6 +1667,10 @@ class PlaneTracker:
     
     def draw_airline_icon(self, x, y, airline_code):
         """Draw airline logo PNG if available; otherwise fallback colored 11x11 block."""
+        raw = self._raw_logos.get(airline_code)
+        if raw:
+            self._draw_rgb565_11(raw, x, y)
+            return
         filename = self.get_airline_png_filename(airline_code)
         if not self.draw_png_fitted_11(filename, x, y):
             # Fallback to plane symbol instead of color block
@@ -762,6 +1685,17 @@ class PlaneTracker:
             except Exception:
                 pass
 
+    def _file_older_than(self, path, ttl):
+        """True when the file's mtime is known and more than ttl seconds
+        old; False when the filesystem doesn't report mtimes."""
+        try:
+            mtime = os.stat(path)[8]
+        except Exception:
+            return False
+        if not mtime:
+            return False
+        return (time.time() - mtime) > ttl
+
     def file_size(self, path):
         try:
             st = os.stat(path)
@@ -770,105 +1704,174 @@ class PlaneTracker:
             return -1
 
     def sync_github_logos(self):
-        """Fetch PNGs for known airlines without listing the GitHub directory to avoid large JSON.
-        Attempts direct downloads from a known raw base URL.
-        """
+        try:
+            self._sync_github_logos()
+        finally:
+            # New files may have appeared; drop stale path/dimension caches
+            # and rebuild the scanned logo map
+            self._logo_path_cache.clear()
+            self._png_dim_cache.clear()
+            self._scan_logos()
+            self._preload_logos()
+
+    def _stream_to_file(self, response, local_path):
+        """Stream an HTTP response body straight to flash in 1 KB chunks so
+        the full payload never has to sit in RAM alongside the file buffer.
+        Closes the response; removes a partially written file on error."""
+        try:
+            f = open(local_path, 'wb')
+        except Exception:
+            response.close()
+            return False
+        ok = False
+        try:
+            raw = getattr(response, 'raw', None)
+            if raw is None:
+                # No raw socket exposed on this urequests build
+                f.write(response.content)
+            else:
+                while True:
+                    chunk = raw.read(1024)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+            ok = True
+        except Exception:
+            pass
+        finally:
+            f.close()
+            response.close()
+        if not ok:
+            try:
+                os.remove(local_path)
+            except Exception:
+                pass
+        return ok
+
+    def _fetch_logos_manifest(self):
+        """Fetch the committed manifest.json from the raw base: one small
+        CDN-cached GET that lists every available logo, so the sync knows
+        exactly what exists upstream without probing per code."""
+        if not (self.USE_LOGOS_MANIFEST and self.LOGOS_MANIFEST_URL):
+            return None
+        try:
+            r = self._http_get(self.LOGOS_MANIFEST_URL,
+                               {'User-Agent': 'GalacticUnicorn-PlaneTracker/1.0'})
+            if r.status_code == 200:
+                manifest = r.json()
+                r.close()
+                if isinstance(manifest, dict) and manifest:
+                    return manifest
+            else:
+                r.close()
+        except Exception:
+            pass
+        return None
+
+    def _sync_github_logos(self):
+        """Fetch PNGs for known airlines straight from the raw base URL.
+        No directory listing: the airline set is known locally, and per-file
+        ETags stored in logos/_etags.json make re-syncs conditional GETs
+        that usually come back 304 with no body."""
         self.ensure_dir("logos")
 
-        # If listing is explicitly allowed, fall back to API listing method
-        if self.ALLOW_API_LOGO_LISTING:
+        etags = {}
+        if self.GITHUB_CONDITIONAL:
             try:
-                api_url = GITHUB_LOGOS_API_URL
-            except NameError:
-                api_url = None
-            if api_url:
-                # try listing (may OOM); if it fails, fall back silently
+                with open(self.GITHUB_ETAG_PATH) as f:
+                    etags = json.load(f)
+            except Exception:
+                pass
+        etags_dirty = False
+
+        # Prefer the manifest's view of what exists upstream; fall back
+        # to probing the known airline codes when it isn't available
+        manifest = self._fetch_logos_manifest()
+        codes = sorted(manifest) if manifest else self._airline_codes_sorted
+
+        jobs = []
+        for code in codes:
+            name = (manifest.get(code) if manifest else None) or f"{code}.png"
+            local_path = f"logos/{name}"
+            have_file = self.file_size(local_path) > 0
+            etag = etags.get(name)
+            if not have_file:
+                # Fresh negative entry: remembered 404, skip the request
+                ts = self._logo_missing_ts.get(local_path)
+                if ts is not None and time.time() - ts < self.LOGO_NEG_TTL:
+                    continue
+            if have_file and not etag:
+                # Local copy without a validator: keep it until it ages out
+                if not self._file_older_than(local_path, self.LOGO_POS_TTL):
+                    continue
+            headers = {'User-Agent': 'GalacticUnicorn-PlaneTracker/1.0'}
+            if have_file and etag:
+                headers['If-None-Match'] = etag
+            jobs.append((code, name, local_path, headers))
+
+        def handle(code, name, local_path, r):
+            nonlocal etags_dirty
+            if r.status_code == 200:
+                print(f"Downloading logo for {code}")
+                new_etag = None
                 try:
-                    headers = {'User-Agent': 'GalacticUnicorn-PlaneTracker/1.0', 'Accept': 'application/vnd.github+json'}
-                    try:
-                        token = GITHUB_TOKEN
-                        if token:
-                            headers['Authorization'] = f'Bearer {token}'
-                    except NameError:
-                        pass
-                    try:
-                        resp = urequests.get(api_url, headers=headers, timeout=10)
-                    except TypeError:
-                        resp = urequests.get(api_url, headers=headers)
-                    if resp.status_code == 200:
-                        listing = resp.json()
-                        resp.close()
-                        # best-effort download from listing
-                        for item in listing:
-                            try:
-                                if not item or item.get('type') != 'file':
-                                    continue
-                                name = item.get('name', '')
-                                if not name.lower().endswith('.png'):
-                                    continue
-                                download_url = item.get('download_url')
-                                local_path = f"logos/{name}"
-                                # Skip if already present
-                                if self.file_size(local_path) > 0:
-                                    continue
-                                try:
-                                    r = urequests.get(download_url, headers={'User-Agent': 'GalacticUnicorn-PlaneTracker/1.0'}, timeout=10)
-                                except TypeError:
-                                    r = urequests.get(download_url, headers={'User-Agent': 'GalacticUnicorn-PlaneTracker/1.0'})
-                                if r.status_code == 200:
-                                    data = r.content
-                                    r.close()
-                                    with open(local_path, 'wb') as f:
-                                        f.write(data)
-                                else:
-                                    r.close()
-                                gc.collect()
-                            except Exception:
-                                gc.collect()
-                        return
-                    else:
-                        resp.close()
+                    new_etag = getattr(r, 'headers', {}).get('etag')
                 except Exception:
-                    # fall through to raw base method
                     pass
+                if self._stream_to_file(r, local_path):
+                    self._logo_missing_ts.pop(local_path, None)
+                    if self._logo_paths.get(local_path, 0) is None:
+                        del self._logo_paths[local_path]
+                    if new_etag and etags.get(name) != new_etag:
+                        etags[name] = new_etag
+                        etags_dirty = True
+            elif r.status_code == 404:
+                # Negative-cache the miss so the next syncs skip it
+                r.close()
+                self._logo_paths[local_path] = None
+                self._logo_missing_ts[local_path] = time.time()
+                self._caches_dirty = True
+            else:
+                # 304 Not Modified keeps the local copy; anything else
+                # is left for the next sync
+                r.close()
 
-        # Raw base method: try known airline codes only (small set) to avoid listing
-        known_codes = list(self.commercial_airlines)
-        for code in known_codes:
-            print(f"Downloading logo for {code}")
-            name = f"{code}.png"
-            local_path = f"logos/{name}"
-            if self.file_size(local_path) > 0:
-                print(f"Logo for {code} already exists")
-                continue
-            url = f"{self.GITHUB_LOGOS_RAW_BASE}/{name}"
+        # Batch the downloads over one keep-alive connection so a batch
+        # costs ~one round trip instead of one per file
+        done = 0
+        if jobs:
             try:
-                try:
-                    r = urequests.get(url, headers={'User-Agent': 'GalacticUnicorn-PlaneTracker/1.0'}, timeout=10)
-                except TypeError:
-                    r = urequests.get(url, headers={'User-Agent': 'GalacticUnicorn-PlaneTracker/1.0'})
-                if r.status_code == 200:
-                    data = r.content
-                    r.close()
-                    try:
-                        with open(local_path, 'wb') as f:
-                            f.write(data)
-                    except Exception:
-                        pass
-                else:
-                    r.close()
+                urls = [f"{self.GITHUB_LOGOS_RAW_BASE}/{j[1]}" for j in jobs]
+                hdrs = [j[3] for j in jobs]
+                for k, r in self._session.get_pipelined(urls, hdrs):
+                    handle(jobs[k][0], jobs[k][1], jobs[k][2], r)
+                    done = k + 1
             except Exception:
                 pass
-            gc.collect()
-    
+        # Serial fallback for anything the pipeline didn't finish
+        for code, name, local_path, headers in jobs[done:]:
+            try:
+                r = self._http_get(f"{self.GITHUB_LOGOS_RAW_BASE}/{name}", headers)
+                handle(code, name, local_path, r)
+            except Exception:
+                pass
+
+        if etags_dirty and self.GITHUB_CONDITIONAL:
+            try:
+                with open(self.GITHUB_ETAG_PATH, 'w') as f:
+                    json.dump(etags, f)
+            except Exception:
+                pass
+
     def draw_corner_indicators(self, color):
         """Draw LEDs in corners to show system status"""
         self.graphics.set_pen(color)
+        pixel = self.graphics.pixel
         # Draw in actual corners
-        self.graphics.pixel(0, 0)                          # Top-left
-        self.graphics.pixel(self.width - 1, 0)             # Top-right
-        self.graphics.pixel(0, self.height - 1)            # Bottom-left
-        self.graphics.pixel(self.width - 1, self.height - 1)  # Bottom-right
+        pixel(0, 0)                          # Top-left
+        pixel(self.width - 1, 0)             # Top-right
+        pixel(0, self.height - 1)            # Bottom-left
+        pixel(self.width - 1, self.height - 1)  # Bottom-right
     
     def draw_scrolling_text(self, text, x, y, color, max_width=None):
         """Draw text that scrolls horizontally if too long"""
@@ -900,6 +1903,29 @@ class PlaneTracker:
             self.graphics.text(text, scroll_x, y, scale=1)
             return max_width
     
+    def _load_cached_token(self):
+        """Reuse a persisted OAuth token across reboots while still valid,
+        skipping the boot-time token exchange entirely."""
+        try:
+            with open(self.TOKEN_CACHE_PATH) as f:
+                data = json.load(f)
+            if data.get('access_token') and time.time() < data.get('expires_at', 0):
+                self.auth_token = data['access_token']
+                self.token_expires = data['expires_at']
+                print("Reusing cached OAuth token")
+        except Exception:
+            pass
+
+    def _save_cached_token(self):
+        try:
+            tmp = self.TOKEN_CACHE_PATH + '.tmp'
+            with open(tmp, 'w') as f:
+                json.dump({'access_token': self.auth_token,
+                           'expires_at': self.token_expires}, f)
+            os.rename(tmp, self.TOKEN_CACHE_PATH)
+        except Exception:
+            pass
+
     def get_auth_token(self):
         """Get OAuth token from OpenSky API using client credentials or username/password"""
         current_time = time.time()
@@ -926,7 +1952,7 @@ class PlaneTracker:
         """Get OAuth token using client credentials flow"""
         try:
             # OpenSky uses Keycloak for OAuth authentication
-            token_url = "https://auth.opensky-network.org/auth/realms/opensky-network/protocol/openid-connect/token"
+            token_url = self.TOKEN_URL
             
             print(f"Requesting OAuth token from: {token_url}")
             print(f"Client ID: {OPENSKY_CLIENT_ID}")
@@ -939,7 +1965,7 @@ class PlaneTracker:
             data = f"grant_type=client_credentials&client_id={OPENSKY_CLIENT_ID}&client_secret={OPENSKY_CLIENT_SECRET}"
             
             print("Making OAuth token request...")
-            response = urequests.post(token_url, headers=headers, data=data)
+            response = self._http_post(token_url, headers=headers, data=data)
             print(f"OAuth response status: {response.status_code}")
             
             if response.status_code == 200:
@@ -951,7 +1977,8 @@ class PlaneTracker:
                     self.auth_token = token_data['access_token']
                     # Use expires_in if provided, otherwise default to 25 minutes
                     expires_in = token_data.get('expires_in', 1800)  # Default 30 min
-                    self.token_expires = time.time() + expires_in - 300  # Refresh 5 min early
+                    self.token_expires = time.time() + expires_in - self.TOKEN_REFRESH_SAFETY
+                    self._save_cached_token()
                     print(f"✓ Got OAuth token, expires in {expires_in} seconds")
                     print(f"Token preview: {self.auth_token[:20]}...")
                     return self.auth_token
@@ -991,7 +2018,7 @@ class PlaneTracker:
             credentials = ubinascii.b2a_base64(f"{OPENSKY_USERNAME}:{OPENSKY_PASSWORD}".encode()).decode().strip()
             headers = {'Authorization': f'Basic {credentials}'}
             
-            response = urequests.post(auth_url, headers=headers)
+            response = self._http_post(auth_url, headers=headers)
             
             if response.status_code == 200:
                 token_data = response.json()
@@ -1001,6 +2028,7 @@ class PlaneTracker:
                     self.auth_token = token_data['token']
                     # Tokens expire after 30 minutes, refresh after 25 minutes
                     self.token_expires = time.time() + 1500  # 25 minutes
+                    self._save_cached_token()
                     return self.auth_token
             else:
                 print(f"OAuth user token failed: {response.status_code}")
@@ -1011,6 +2039,98 @@ class PlaneTracker:
             print(f"OAuth user token error: {e}")
             return None
     
+    def _iter_states(self, response):
+        """Incrementally parse the "states" array from an OpenSky response,
+        yielding one state list at a time. Reading the socket in small
+        chunks and discarding each element after the caller filters it
+        means the full payload never has to fit in RAM (the whole-payload
+        json() parse is what used to raise MemoryError). Falls back to a
+        full parse when the response has no raw stream."""
+        raw = getattr(response, 'raw', None)
+        if raw is None:
+            data = response.json()
+            for state in (data.get('states') or []):
+                yield state
+            return
+
+        # Scan forward to the start of the states value
+        key = b'"states":'
+        buf = b''
+        while True:
+            chunk = raw.read(512)
+            if not chunk:
+                return
+            buf += chunk
+            idx = buf.find(key)
+            if idx >= 0:
+                buf = buf[idx + len(key):]
+                break
+            # Keep only a tail big enough to hold a key split across chunks
+            if len(buf) > len(key):
+                buf = buf[-len(key):]
+
+        # Walk the array tracking depth and string state; each depth-2
+        # [...] slice is one state vector, parsed and handed to the caller
+        depth = 0
+        in_str = False
+        esc = False
+        start = -1
+        pos = 0
+        while True:
+            if pos >= len(buf):
+                if start < 0:
+                    buf = b''
+                else:
+                    buf = buf[start:]
+                    start = 0
+                pos = len(buf)
+                chunk = raw.read(512)
+                if not chunk:
+                    return
+                buf += chunk
+                continue
+            c = buf[pos]
+            if in_str:
+                if esc:
+                    esc = False
+                elif c == 92:    # backslash
+                    esc = True
+                elif c == 34:    # quote
+                    in_str = False
+            elif c == 34:        # quote
+                in_str = True
+            elif c == 91:        # [
+                depth += 1
+                if depth == 2:
+                    start = pos
+            elif c == 93:        # ]
+                if depth == 2 and start >= 0:
+                    try:
+                        yield json.loads(buf[start:pos + 1])
+                    except Exception:
+                        pass
+                    start = -1
+                depth -= 1
+                if depth <= 0:
+                    return
+            pos += 1
+
+    def _states_request(self, url, headers):
+        """GET the states endpoint. On a 401 the token has gone stale
+        mid-interval: refresh it and retry once inline so the user sees
+        current data instead of a minute-long gap."""
+        response = self._http_get(url, headers)
+        if response.status_code == 401 and 'Authorization' in headers:
+            print("401 from states - refreshing token and retrying")
+            response.close()
+            self.auth_token = None
+            self.token_expires = 0
+            token = self.get_auth_token()
+            if token:
+                headers['Authorization'] = f'Bearer {token}'
+                response = self._http_get(url, headers)
+        return response
+
     def fetch_planes(self):
         """Fetch plane data from OpenSky API"""
         self.fetching_data = True
@@ -1018,23 +2138,15 @@ class PlaneTracker:
         
         # Clear any existing planes to free memory
         self.planes = []
-        gc.collect()
+        self._gc_if_low()
         
         try:
-            # Calculate bounding box
-            lat_delta = SEARCH_RADIUS_KM / 111.0
-            lon_delta = SEARCH_RADIUS_KM / (111.0 * math.cos(math.radians(HOME_LAT)))
-            
-            lamin = HOME_LAT - lat_delta
-            lamax = HOME_LAT + lat_delta
-            lomin = HOME_LON - lon_delta
-            lomax = HOME_LON + lon_delta
-            
-            # Build URL
-            url = f"https://opensky-network.org/api/states/all?lamin={lamin}&lamax={lamax}&lomin={lomin}&lomax={lomax}"
-            
+            # Bounding-box URL and UA header are precomputed in __init__
+            url = self._api_url
+
             # Set up authentication headers
             headers = {}
+            headers.update(self._base_headers)
             auth_failed = False
             
             # Try OAuth first (client credentials preferred, then username/password)
@@ -1057,9 +2169,6 @@ class PlaneTracker:
                     except Exception as e:
                         auth_failed = True
             
-            # Add user agent to help with rate limiting
-            headers['User-Agent'] = 'GalacticUnicorn-PlaneTracker/1.0'
-            
             # If authentication completely failed, don't make the request
             if auth_failed and (OPENSKY_CLIENT_ID or OPENSKY_USERNAME):
                 return
@@ -1071,43 +2180,78 @@ class PlaneTracker:
             else:
                 print("Using anonymous access")
                 
-            try:
-                response = urequests.get(url, headers=headers, timeout=10)
-            except TypeError:
-                # Some urequests versions don't support timeout kwarg
-                response = urequests.get(url, headers=headers)
+            response = self._states_request(url, headers)
             print(f"API response status: {response.status_code}")
             
             if response.status_code == 200:
-                try:
-                    data = response.json()
-                except MemoryError:
-                    print("JSON parse MemoryError")
-                    self.last_error_message = "UPDATE ERROR"
-                    response.close()
-                    return
-                response.close()
-                
                 # Clear old planes and collect garbage before processing new data
                 self.planes = []
                 gc.collect()
-                
-                if data and 'states' in data and data['states']:
-                    count_added = 0
-                    for state in data['states']:
+
+                count_added = 0
+                # Locals for everything touched per state: MicroPython
+                # resolves self./global names through dict lookups on every
+                # access, which adds up over a few hundred states
+                planes_append = self.planes.append
+                is_com = self.is_commercial_flight
+                max_planes = self.MAX_PLANES
+                home_lat = HOME_LAT
+                home_lon = HOME_LON
+                home_cos = self._home_cos_lat
+                home_lat_rad = self._home_lat_rad
+                home_lon_rad = self._home_lon_rad
+                radius_sq = self._radius_sq
+                radius_km = SEARCH_RADIUS_KM
+                alt_min = ALTITUDE_FILTER_MIN
+                alt_max = ALTITUDE_FILTER_MAX
+                show_ground = SHOW_GROUND_AIRCRAFT
+                filter_onground = self.FILTER_ONGROUND
+                radians = math.radians
+                cos = math.cos
+                sin = math.sin
+                hav = self._haversine_rad
+                try:
+                    for state in self._iter_states(response):
+                        # Drop on-ground states before any distance math
+                        if filter_onground and state[8]:
+                            continue
                         if state[6] is not None and state[5] is not None:  # Has lat/lon
-                            distance = self.haversine_distance(HOME_LAT, HOME_LON, state[6], state[5])
-                            if distance <= SEARCH_RADIUS_KM:
+                            # Equirectangular prefilter: two multiplies per
+                            # state instead of trig; haversine (with its 3
+                            # transcendental calls) only runs on survivors
+                            dx = (state[5] - home_lon) * home_cos * 111.0
+                            dy = (state[6] - home_lat) * 111.0
+                            if dx * dx + dy * dy > radius_sq:
+                                continue
+                            lat_rad = radians(state[6])
+                            lon_rad = radians(state[5])
+                            cos_lat = cos(lat_rad)
+                            distance = hav(
+                                home_cos, home_lat_rad, home_lon_rad,
+                                cos_lat, lat_rad, lon_rad)
+                            if distance <= radius_km:
                                 # Apply altitude filters if configured
                                 altitude = state[7] if state[7] else 0
-                                if (ALTITUDE_FILTER_MIN <= altitude <= ALTITUDE_FILTER_MAX and
-                                    (SHOW_GROUND_AIRCRAFT or not (state[8] if state[8] is not None else False))):
+                                if (alt_min <= altitude <= alt_max and
+                                    (show_ground or not (state[8] if state[8] is not None else False))):
                                     
+                                    callsign = state[1].strip() if state[1] else 'Unknown'
+                                    norm_cs = callsign.upper()
                                     plane = {
                                         'icao24': state[0],
-                                        'callsign': state[1].strip() if state[1] else 'Unknown',
+                                        'callsign': callsign,
+                                        # Normalized once at ingest so render
+                                        # paths avoid per-frame str allocation
+                                        '_norm_cs': norm_cs,
+                                        '_airline': norm_cs[:3],
                                         'latitude': state[6],
                                         'longitude': state[5],
+                                        # Radian/trig values cached for any
+                                        # later distance/bearing math
+                                        '_lat_rad': lat_rad,
+                                        '_lon_rad': lon_rad,
+                                        '_sin_lat': sin(lat_rad),
+                                        '_cos_lat': cos_lat,
                                         'altitude': altitude,
                                         # omit velocity/heading to reduce memory
                                         'distance': distance,
@@ -1116,12 +2260,18 @@ class PlaneTracker:
                                     }
                                     
                                     # Only add commercial flights
-                                    if self.is_commercial_flight(plane):
-                                        self.planes.append(plane)
+                                    if is_com(plane):
+                                        planes_append(plane)
                                         count_added += 1
-                                        if count_added >= self.MAX_PLANES:
+                                        if count_added >= max_planes:
                                             break
-                
+                except MemoryError:
+                    print("JSON parse MemoryError")
+                    self.last_error_message = "UPDATE ERROR"
+                    response.close()
+                    return
+                response.close()
+
                 # Sort by distance for information only
                 self.planes.sort(key=lambda x: x['distance'])
                 print(f"✓ Found {len(self.planes)} flights (capped {len(self.planes)}/{self.MAX_PLANES}) in {SEARCH_RADIUS_KM}km radius")
@@ -1132,18 +2282,16 @@ class PlaneTracker:
                 except Exception as e:
                     print(f"Queue merge error: {e}")
                 self.api_success = True
-                
-                # Clean up the large data structure
-                del data
-                gc.collect()
-                
+                self._consecutive_429 = 0
+                self._gc_if_low()
+
             elif response.status_code == 401:
+                # The inline refresh+retry already happened; only a second
+                # 401 lands here, so back off for a minute
                 print("✗ 401 Unauthorized - token expired/invalid")
                 response.close()
-                # Clear invalid token
                 self.auth_token = None
                 self.token_expires = 0
-                # Wait before retry
                 self.fetch_due_at = time.time() + 60
                 
             elif response.status_code == 403:
@@ -1163,8 +2311,11 @@ class PlaneTracker:
             elif response.status_code == 429:
                 print("✗ 429 Rate Limited")
                 response.close()
-                # Wait much longer if rate limited
-                self.fetch_due_at = time.time() + 300  # 5 minute delay
+                # Exponential backoff: doubles per consecutive 429
+                delay = min(self.BACKOFF_MAX,
+                            self.BACKOFF_ON_429 * (2 ** self._consecutive_429))
+                self._consecutive_429 += 1
+                self.fetch_due_at = time.time() + delay
                 
             else:
                 print(f"✗ API Error: {response.status_code}")
@@ -1176,41 +2327,73 @@ class PlaneTracker:
         except Exception as e:
             print(f"API request failed: {e}")
             self.last_error_message = "UPDATE ERROR"
-            # Force garbage collection on errors too
-            gc.collect()
-        
-        self.fetching_data = False
-        gc.collect()  # Clean up memory
+            self._gc_if_low()
+        finally:
+            # Always clear the in-flight flag: the early returns above
+            # (auth failure, parse MemoryError) must not leave it stuck
+            # True, which would disable route fetching permanently
+            self.fetching_data = False
+            self._gc_if_low()
     
     def merge_display_queue(self, new_list):
         """Merge new planes into persistent display_queue.
         Keep existing order for survivors, drop missing, append new planes.
+        Updates the list in place with reused scratch sets so the merge
+        allocates next to nothing.
         """
-        # Prepare key set from new list
+        seen = self._merge_seen
+        existing = self._merge_existing
+        seen.clear()
+        existing.clear()
+
         new_keys = []
-        seen = set()
         for p in new_list:
             k = p.get('icao24') or p.get('callsign')
             if not k or k in seen:
-                continue
-            seen.add(k)
+                k = None
+            else:
+                seen.add(k)
             new_keys.append(k)
 
-        def key_of(p):
-            return p.get('icao24') or p.get('callsign')
-
-        # Filter current queue to those still present
-        filtered = [p for p in self.display_queue if key_of(p) in seen]
+        # Compact survivors in place, then truncate
+        queue = self.display_queue
+        w = 0
+        for p in queue:
+            k = p.get('icao24') or p.get('callsign')
+            if k in seen:
+                queue[w] = p
+                w += 1
+                existing.add(k)
+        del queue[w:]
 
         # Append brand-new planes in order
-        existing = set(key_of(p) for p in filtered)
-        for p in new_list:
-            k = key_of(p)
-            if k and k not in existing:
-                filtered.append(p)
+        for i, p in enumerate(new_list):
+            k = new_keys[i]
+            if k is not None and k not in existing:
+                queue.append(p)
                 existing.add(k)
 
-        self.display_queue = filtered
+        # Resolve display callsign and route once per merge so the render
+        # path reads plain dict fields instead of calling these per frame
+        for p in queue:
+            cs = p.get('_norm_cs') or p.get('callsign', '').strip()
+            p['_display_cs'] = self.get_display_callsign(cs)
+            route = self.get_route(cs)
+            p['_route'] = route
+            p['_route_widths'] = self._route_widths(route)
+        self._display_epoch += 1
+
+    def _route_widths(self, route):
+        """Widths of the origin, arrow and destination segments of a
+        'AAA>BBB' route string, measured once so the per-frame route draw
+        is three text calls with no measurement."""
+        if not route:
+            return None
+        parts = route.split('>')
+        if len(parts) != 2:
+            return None
+        return (self._tw(parts[0], scale=1), self._tw('>', scale=1),
+                self._tw(parts[1], scale=1))
 
     def _frame_cycle_index(self):
         # Cycle: 4 plane frames then 1 time frame
@@ -1245,26 +2428,23 @@ class PlaneTracker:
             self.draw_corner_indicators(self.YELLOW)
             # Show error text if available
             if self.last_error_message:
-                try:
-                    self.graphics.set_font("bitmap6")
-                except:
-                    pass
+                self._use_font("bitmap6")
                 self.graphics.set_pen(self.YELLOW)
                 # Center "UPDATE ERROR" if it fits
                 msg = self.last_error_message
-                w = int(self.graphics.measure_text(msg, scale=1))
+                w = self._tw(msg, scale=1)
                 x = max(0, (self.width - w) // 2)
                 self.graphics.text(msg, x, 2, scale=1)
             return
         
         # Rotate frames every 3 seconds: plane, plane, plane, plane, time
-        current_time = time.time()
+        current_time = self._now
         if current_time - self.last_frame_time >= 4:
             self.frame_index += 1
             self.last_frame_time = current_time
 
         # Plane count overlay supersedes normal content
-        now = time.time()
+        now = self._now
         if self.count_overlay_until and now < self.count_overlay_until:
             self.graphics.set_pen(self.BLACK)
             self.graphics.clear()
@@ -1272,12 +2452,9 @@ class PlaneTracker:
             self.draw_plane_symbol(0, 0)
             count = len(self.display_queue)
             msg = f"{count} Flights" if count != 1 else "1 Flight"
-            try:
-                self.graphics.set_font("bitmap6")
-            except:
-                pass
+            self._use_font("bitmap6")
             self.graphics.set_pen(self.CYAN)
-            w = int(self.graphics.measure_text(msg, scale=1))
+            w = self._tw(msg, scale=1)
             x = max(13, (self.width - w) // 2)
             self.graphics.text(msg, x, 2, scale=1)
             return
@@ -1303,33 +2480,44 @@ class PlaneTracker:
         except Exception:
             self.draw_plane_icon_with_time()
             return
-        callsign = plane.get('callsign', '').strip()
+        callsign = plane.get('_norm_cs') or plane.get('callsign', '').strip()
 
         # Draw current plane without animation
-        self.draw_logo_for_callsign(callsign)
-        display_cs = self.get_display_callsign(callsign)
+        self.draw_logo_for_callsign(callsign, plane.get('_airline'))
+        display_cs = plane.get('_display_cs')
+        if not display_cs:
+            display_cs = self.get_display_callsign(callsign)
         self.draw_callsign_two_tone(display_cs, 13, -1, self.WHITE, self.LIGHTBLUE)
-        route = self.get_route(callsign)
+        route = plane.get('_route')
+        if route is None:
+            # Not resolved at merge time; picks up async fetches mid-cycle
+            route = self.get_route(callsign)
+            if route:
+                plane['_route'] = route
+                plane['_route_widths'] = self._route_widths(route)
         if route:
             # Draw route with normal font: YELLOW code, ORANGE arrow, YELLOW code
-            try:
-                self.graphics.set_font("bitmap6")
-            except Exception:
-                pass
+            self._use_font("bitmap6")
+            set_pen = self.graphics.set_pen
+            text = self.graphics.text
             # Split on '>'
             parts = route.split('>')
             if len(parts) == 2:
                 o, d = parts[0], parts[1]
+                widths = plane.get('_route_widths')
+                if widths is None:
+                    widths = self._route_widths(route)
+                    plane['_route_widths'] = widths
                 x = 13
                 y = 5
-                self.graphics.set_pen(self.YELLOW)
-                self.graphics.text(o, x, y, scale=1)
-                x += int(self.graphics.measure_text(o, scale=1))
-                self.graphics.set_pen(self.ORANGE)
-                self.graphics.text('>', x, y, scale=1)
-                x += int(self.graphics.measure_text('>', scale=1))
-                self.graphics.set_pen(self.YELLOW)
-                self.graphics.text(d, x, y, scale=1)
+                set_pen(self.YELLOW)
+                text(o, x, y, scale=1)
+                x += widths[0]
+                set_pen(self.ORANGE)
+                text('>', x, y, scale=1)
+                x += widths[1]
+                set_pen(self.YELLOW)
+                text(d, x, y, scale=1)
 
         # (removed bottom overlay; handled earlier as a full-screen overlay)
     
@@ -1346,6 +2534,22 @@ class PlaneTracker:
         except Exception:
             pass
 
+        # Skip the redraw and LED push entirely when nothing that reaches
+        # the screen has changed since the last frame. The clock renders at
+        # minute resolution, so the minute field is enough for time frames;
+        # _display_epoch covers data arriving between frame ticks.
+        now = self._now
+        key = (self.night_mode, self.clock_only, self.fetching_data,
+               self.api_success, self.last_error_message,
+               self.frame_index, self._display_epoch,
+               len(self.display_queue),
+               tm[2], tm[3], tm[4],
+               bool(self.count_overlay_until and now < self.count_overlay_until),
+               now - self.last_frame_time >= 4)
+        if key == self._last_state_key:
+            return False
+        self._last_state_key = key
+
         if self.night_mode:
             # Clock only, no API activity here
             self.graphics.set_pen(self.BLACK)
@@ -1354,9 +2558,51 @@ class PlaneTracker:
         else:
             self.draw_info_display()
         self.gu.update(self.graphics)
-        # Periodic garbage collection to prevent memory leaks
-        gc.collect()
+        self._gc_if_low()
+        return True
     
+    def _gc_if_low(self):
+        """Collect only when free memory is actually low; a full
+        collection is O(heap) and stalls the display for tens of ms."""
+        try:
+            if gc.mem_free() < 20000:
+                gc.collect()
+        except AttributeError:
+            gc.collect()
+
+    def _idle_sleep(self, duration):
+        """Sleep in short slices, returning early when any button goes
+        down so idle batching doesn't cost input latency."""
+        gu = self.gu
+        remaining = duration
+        while remaining > 0:
+            step = 0.05 if remaining > 0.05 else remaining
+            time.sleep(step)
+            remaining -= step
+            if (gu.is_pressed(GalacticUnicorn.SWITCH_A) or
+                    gu.is_pressed(GalacticUnicorn.SWITCH_B) or
+                    gu.is_pressed(GalacticUnicorn.SWITCH_D)):
+                return
+
+    def _button_pressed(self, switch):
+        """True once per press: fires on the False->True edge, ignoring
+        state flips within 50 ms of the last change (contact bounce)."""
+        pressed = self.gu.is_pressed(switch)
+        state = self._btn_state.get(switch, False)
+        if pressed == state:
+            return False
+        if hasattr(time, 'ticks_ms'):
+            now = time.ticks_ms()
+            elapsed = time.ticks_diff(now, self._btn_last_change.get(switch, 0))
+        else:
+            now = int(time.time() * 1000)
+            elapsed = now - self._btn_last_change.get(switch, 0)
+        if elapsed < 50:
+            return False
+        self._btn_state[switch] = pressed
+        self._btn_last_change[switch] = now
+        return pressed
+
     def run(self):
         """Main program loop"""
         # Connect to WiFi
@@ -1367,14 +2613,11 @@ class PlaneTracker:
                 self.graphics.clear()
                 self.draw_corner_indicators(self.RED)
                 # Show WIFI ERROR message
-                try:
-                    self.graphics.set_font("bitmap6")
-                except:
-                    pass
+                self._use_font("bitmap6")
                 self.graphics.set_pen(self.RED)
                 msg = "WIFI ERROR"
                 try:
-                    w = int(self.graphics.measure_text(msg, scale=1))
+                    w = self._tw(msg, scale=1)
                 except Exception:
                     w = len(msg) * 4
                 x = max(0, (self.width - w) // 2)
@@ -1392,14 +2635,15 @@ class PlaneTracker:
         # Main loop
         while True:
             current_time = time.time()
-            
+            self._now = current_time
+
             # One-time NTP sync soon after boot and periodic resync
             if self.wifi_connected and (not self.ntp_ok or (current_time - self.ntp_last_sync > self.NTP_SYNC_INTERVAL)):
                 self.sync_ntp()
             
-            # Initialize fetch_due_at so the first loop triggers an update
+            # Schedule the first update, offset by the boot jitter
             if self.fetch_due_at == 0:
-                self.fetch_due_at = current_time
+                self.fetch_due_at = current_time + self._first_poll_offset
 
             # Periodic GitHub logos re-sync
             if current_time - self.last_logos_sync > self.LOGOS_SYNC_INTERVAL:
@@ -1408,36 +2652,52 @@ class PlaneTracker:
                 except Exception as e:
                     print(f"Logo periodic sync failed: {e}")
                 self.last_logos_sync = current_time
-                gc.collect()
+                self._gc_if_low()
             
             # Update plane data periodically (skip during night mode)
             if not self.night_mode and current_time >= self.fetch_due_at:
                 self.fetch_planes()
                 self.last_api_update = current_time
                 self.fetch_due_at = current_time + self.API_INTERVAL
+
+            # Drain one queued route lookup per tick
+            if not self.night_mode:
+                self.process_route_queue()
+
+            # Periodically persist caches so reboots skip refetches
+            if self._caches_dirty and current_time - self._caches_last_save > 300:
+                self.save_caches()
+
+            # Update display; remembers whether anything was pushed
+            redrew = self.update_display()
             
-            # Update display
-            self.update_display()
-            
-            # Handle button presses
-            if self.gu.is_pressed(GalacticUnicorn.SWITCH_A):
+            # Handle button presses: edge-triggered with a short hysteresis
+            # window, so the loop keeps running while a button is held
+            # instead of sleeping 300 ms per press
+            if self._button_pressed(GalacticUnicorn.SWITCH_A):
                 # Toggle clock-only mode
                 self.clock_only = not self.clock_only
-                time.sleep(0.3)  # Debounce
-            if self.gu.is_pressed(GalacticUnicorn.SWITCH_B):
+                self._last_state_key = None
+            if self._button_pressed(GalacticUnicorn.SWITCH_B):
                 # Show plane count for 5 seconds
                 self.count_overlay_until = time.time() + 5
-                time.sleep(0.3)
-            if self.gu.is_pressed(GalacticUnicorn.SWITCH_D):
+                self._last_state_key = None
+            if self._button_pressed(GalacticUnicorn.SWITCH_D):
                 # Force immediate API update
                 self.fetch_planes()
                 now = time.time()
                 self.last_api_update = now
                 # Kick the scheduler so periodic updates resume without button
                 self.fetch_due_at = now + self.API_INTERVAL
-                time.sleep(0.3)
             
-            time.sleep(DISPLAY_UPDATE_INTERVAL)
+            # Night mode and unchanged frames tick at the idle interval;
+            # the interruptible sleep keeps buttons responsive either way
+            if self.night_mode:
+                self._idle_sleep(1.0)
+            elif self.DISPLAY_BATCH_DIRTY and not redrew:
+                self._idle_sleep(self.DISPLAY_IDLE_REDRAW)
+            else:
+                time.sleep(self.DISPLAY_MIN_REDRAW)
 
 # Create and run the plane tracker
 if __name__ == "__main__":
@@ -0,0 +1,25 @@
+# MicroPython frozen-manifest for the flight tracker.
+#
+# Freezing secrets.py into the firmware image stores its bytecode in
+# flash and executes it from XIP, so importing the configuration costs
+# zero heap - the precomputed bbox floats, home trig and URL strings all
+# live in flash instead of the RP2040's 264 KB SRAM.
+#
+# Build from a MicroPython checkout (with the Pimoroni modules for the
+# Galactic Unicorn) like so:
+#
+#   make -C ports/rp2 BOARD=RPI_PICO_W \
+#       FROZEN_MANIFEST=/path/to/galactic-flight-tracker/manifest.py
+#
+# Note that frozen modules are immutable: changing your location or
+# credentials means rebuilding and reflashing. Keep anything you expect
+# to edit (WiFi and API credentials) in a small mutable file on the
+# device filesystem and freeze only the computed constants if you want
+# to tweak settings without a rebuild.
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+# Freeze the derived constants and the aggregator; user_secrets.py stays
+# on the device filesystem so credentials remain editable
+freeze(".", "secrets_derived.py")
+freeze(".", "secrets.py")
@@ -1,30 +1,79 @@
 # resize_logos.py
 import sys, os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
 from PIL import Image
 
-def main(src_dir, out_dir):
+def _box_downsample(arr, new_w, new_h):
+    # Area-average downsample: sum pixel blocks with add.reduceat along
+    # each axis, then divide by the per-block pixel counts. Much cheaper
+    # than LANCZOS for a tiny 11x11 target and plenty sharp at that size.
+    h, w = arr.shape[:2]
+    row_edges = (np.arange(new_h) * h) // new_h
+    col_edges = (np.arange(new_w) * w) // new_w
+    sums = np.add.reduceat(arr.astype(np.float32), row_edges, axis=0)
+    sums = np.add.reduceat(sums, col_edges, axis=1)
+    row_counts = np.diff(np.append(row_edges, h)).astype(np.float32)
+    col_counts = np.diff(np.append(col_edges, w)).astype(np.float32)
+    counts = row_counts[:, None, None] * col_counts[None, :, None]
+    return np.clip(sums / counts + 0.5, 0, 255).astype(np.uint8)
+
+def _write_rgb565(canvas, out_path):
+    # Fixed-size raw frame for the device: 121 big-endian RGB565 pixels
+    # (242 bytes) followed by a 16-byte row-major alpha bitmask. The
+    # tracker blits these with one read instead of decoding a PNG.
+    rgb = canvas[..., :3].astype(np.uint16)
+    v = ((rgb[..., 0] >> 3) << 11) | ((rgb[..., 1] >> 2) << 5) | (rgb[..., 2] >> 3)
+    data = bytearray()
+    for val in v.flatten():
+        data.append((int(val) >> 8) & 0xFF)
+        data.append(int(val) & 0xFF)
+    mask = bytearray(16)
+    for i, a in enumerate(canvas[..., 3].flatten()):
+        if a >= 128:
+            mask[i >> 3] |= 1 << (i & 7)
+    with open(out_path, "wb") as f:
+        f.write(bytes(data) + bytes(mask))
+
+def process_one(name, src_dir, out_dir, raw_dir):
+    in_path = os.path.join(src_dir, name)
+    img = Image.open(in_path).convert("RGBA")
+    w, h = img.size
+    if w == 0 or h == 0:
+        return
+    scale = min(11 / w, 11 / h)
+    new_w = max(1, int(round(w * scale)))
+    new_h = max(1, int(round(h * scale)))
+    arr = np.asarray(img)
+    if new_w < w or new_h < h:
+        resized = _box_downsample(arr, new_w, new_h)
+    else:
+        resized = np.asarray(img.resize((new_w, new_h), Image.BILINEAR))
+    canvas = np.zeros((11, 11, 4), np.uint8)
+    off_x = (11 - new_w) // 2
+    off_y = (11 - new_h) // 2
+    canvas[off_y:off_y + new_h, off_x:off_x + new_w] = resized
+    stem = os.path.splitext(name)[0].upper()
+    out_path = os.path.join(out_dir, stem + ".png")
+    Image.fromarray(canvas, "RGBA").save(out_path, optimize=True)
+    _write_rgb565(canvas, os.path.join(raw_dir, stem + ".rgb565"))
+    print(f"Wrote {out_path}")
+
+def main(src_dir, out_dir, raw_dir):
     os.makedirs(out_dir, exist_ok=True)
-    for name in os.listdir(src_dir):
-        if not name.lower().endswith(".png"):
-            continue
-        in_path = os.path.join(src_dir, name)
-        img = Image.open(in_path).convert("RGBA")
-        w, h = img.size
-        if w == 0 or h == 0:
-            continue
-        scale = min(11 / w, 11 / h)
-        new_w = max(1, int(round(w * scale)))
-        new_h = max(1, int(round(h * scale)))
-        resized = img.resize((new_w, new_h), Image.LANCZOS)
-        canvas = Image.new("RGBA", (11, 11), (0, 0, 0, 0))
-        off_x = (11 - new_w) // 2
-        off_y = (11 - new_h) // 2
-        canvas.paste(resized, (off_x, off_y), resized)
-        out_path = os.path.join(out_dir, os.path.splitext(name)[0].upper() + ".png")
-        canvas.save(out_path, optimize=True)
-        print(f"Wrote {out_path}")
+    os.makedirs(raw_dir, exist_ok=True)
+    names = [n for n in os.listdir(src_dir) if n.lower().endswith(".png")]
+    if not names:
+        return
+    # Each file is independent CPU-bound work, so fan out across cores
+    with ProcessPoolExecutor() as ex:
+        list(ex.map(partial(process_one, src_dir=src_dir, out_dir=out_dir,
+                            raw_dir=raw_dir),
+                    names, chunksize=8))
 
 if __name__ == "__main__":
     src = sys.argv[1] if len(sys.argv) > 1 else "logos_src"
     out = sys.argv[2] if len(sys.argv) > 2 else "logos"
-    main(src, out)
\ No newline at end of file
+    raw = sys.argv[3] if len(sys.argv) > 3 else "logos_raw"
+    main(src, out, raw)
@@ -0,0 +1,182 @@
+# secrets_derived.py - Constants computed once from user_secrets at import
+# Nothing in here needs editing: it recomputes whenever user_secrets
+# changes, and being a separate module it can be frozen into the firmware
+# image (see manifest.py) while user_secrets stays mutable on the device.
+
+import math
+
+from user_secrets import *
+
+__all__ = [
+    'SEARCH_RADIUS_KM_SQ',
+    'HTTP_CONNECT_TIMEOUT', 'HTTP_READ_TIMEOUT', 'HTTP_KEEPALIVE',
+    'LOGO_DECODED_CACHE_DIR', 'LOGO_DECODED_FORMAT',
+    'OPENSKY_TOKEN_URL', 'OPENSKY_TOKEN_REFRESH_SAFETY',
+    'OPENSKY_TOKEN_CACHE_PATH',
+    'API_UPDATE_INTERVAL_ANON', 'API_UPDATE_INTERVAL_AUTH',
+    'API_UPDATE_INTERVAL_OAUTH', 'API_UPDATE_INTERVAL',
+    'API_BACKOFF_ON_429', 'API_BACKOFF_MAX', 'UPDATE_JITTER_SECONDS',
+    'DISPLAY_MIN_REDRAW_INTERVAL', 'DISPLAY_IDLE_REDRAW_INTERVAL',
+    'DISPLAY_BATCH_DIRTY',
+    'ALTITUDE_FILTER_MIN_FT', 'ALTITUDE_FILTER_MAX_FT',
+    'OPENSKY_FILTER_ONGROUND',
+    'LOGO_NEG_CACHE_TTL', 'LOGO_POS_CACHE_TTL', 'LOGO_CACHE_MAX_ENTRIES',
+    'GITHUB_USE_CONDITIONAL_GET', 'GITHUB_ETAG_PATH',
+    'GITHUB_LOGOS_MANIFEST_URL', 'USE_LOGOS_MANIFEST',
+    'GITHUB_ETAG_ENABLED', 'GITHUB_API_RATE_REMAINING_MIN',
+    'github_auth_header',
+    'BBOX_PADDING_KM', 'BBOX_MIN_LAT', 'BBOX_MAX_LAT',
+    'BBOX_MIN_LON', 'BBOX_MAX_LON', 'BBOX_GRID_DEG',
+    'HOME_LAT_RAD', 'HOME_LON_RAD', 'HOME_COS_LAT',
+    'opensky_bbox', 'cache_key', 'within_radius',
+]
+
+SEARCH_RADIUS_KM_SQ = SEARCH_RADIUS_KM * SEARCH_RADIUS_KM  # for squared-distance filters
+
+# HTTP behaviour: bound how long a hung TLS session can stall the loop,
+# and hold sockets open across polls so repeat requests skip the TCP+TLS
+# handshake (the dominant per-request cost on the Pico W)
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_READ_TIMEOUT = 10
+HTTP_KEEPALIVE = True
+
+# OAuth token caching: tokens last ~30 minutes, so persist them and only
+# re-authenticate near expiry. Each avoided token exchange saves a TLS
+# handshake, and the cache file lets a reboot reuse a still-valid token.
+OPENSKY_TOKEN_URL = "https://auth.opensky-network.org/auth/realms/opensky-network/protocol/openid-connect/token"
+OPENSKY_TOKEN_REFRESH_SAFETY = 60   # refresh this many seconds before expiry
+OPENSKY_TOKEN_CACHE_PATH = "/opensky_token.json"
+
+# Seconds between API calls, tiered by access type: OpenSky's daily
+# credit budget differs a lot between anonymous, basic-auth and OAuth
+API_UPDATE_INTERVAL_ANON = 30
+API_UPDATE_INTERVAL_AUTH = 15
+API_UPDATE_INTERVAL_OAUTH = 10
+API_UPDATE_INTERVAL = (API_UPDATE_INTERVAL_OAUTH if OPENSKY_CLIENT_ID
+                       else API_UPDATE_INTERVAL_AUTH if OPENSKY_USERNAME
+                       else API_UPDATE_INTERVAL_ANON)
+# Exponential backoff after HTTP 429: start at the first value, double
+# per consecutive rate-limit, cap at the second
+API_BACKOFF_ON_429 = 60
+API_BACKOFF_MAX = 600
+# Random offset for the first poll so a fleet of trackers booting
+# together doesn't hit OpenSky on the same interval boundaries
+UPDATE_JITTER_SECONDS = 3
+
+# Display batching: when nothing on screen changed, tick the loop at the
+# idle interval instead of the minimum one; LED pushes are bus-bound, so
+# fewer full-buffer refreshes means less SPI traffic and CPU
+DISPLAY_MIN_REDRAW_INTERVAL = 0.1
+DISPLAY_IDLE_REDRAW_INTERVAL = 1.0
+DISPLAY_BATCH_DIRTY = True
+
+# Altitude bounds in feet, converted once at import; code paths that work
+# in feet compare directly instead of converting per aircraft
+_M_TO_FT = 3.28084
+ALTITUDE_FILTER_MIN_FT = ALTITUDE_FILTER_MIN * _M_TO_FT
+ALTITUDE_FILTER_MAX_FT = ALTITUDE_FILTER_MAX * _M_TO_FT
+
+# Derived: drop on-ground states as early as possible in the fetch path
+# (often a third or more of the states in a bbox around an airport)
+OPENSKY_FILTER_ONGROUND = not SHOW_GROUND_AIRCRAFT
+
+# Logo cache tuning: remember "no logo for this airline" for a day so the
+# long tail of unknown operators doesn't re-trigger HTTPS 404s; files
+# without a stored ETag are revalidated weekly; cap the negative cache
+LOGO_NEG_CACHE_TTL = 86400
+LOGO_POS_CACHE_TTL = 604800
+LOGO_CACHE_MAX_ENTRIES = 256
+# Conditional logo fetches: send If-None-Match from the stored ETags so
+# unchanged files come back as a ~200-byte 304 (which GitHub does not
+# count against the rate limit)
+GITHUB_USE_CONDITIONAL_GET = True
+GITHUB_ETAG_PATH = "logos/_etags.json"
+# Logo manifest: one small CDN-cached file on the raw domain listing the
+# available logos, instead of probing per airline code
+GITHUB_LOGOS_MANIFEST_URL = GITHUB_LOGOS_RAW_BASE + "/manifest.json"
+USE_LOGOS_MANIFEST = True
+# Alias kept alongside the manifest settings for callers that only care
+# whether revalidation is on at all
+GITHUB_ETAG_ENABLED = GITHUB_USE_CONDITIONAL_GET
+# Stop calling the rate-limited api.github.com endpoints once the
+# persisted X-RateLimit-Remaining drops below this; raw.githubusercontent
+# fetches are unaffected (they are not rate limited and should never
+# carry an Authorization header)
+GITHUB_API_RATE_REMAINING_MIN = 50
+
+def github_auth_header():
+    """Authorization header for api.github.com calls: empty when no
+    token is configured, so anonymous setups send nothing extra."""
+    if GITHUB_TOKEN:
+        return {"Authorization": "Bearer " + GITHUB_TOKEN}
+    return {}
+
+# Pre-decoded logo frames: resize_logos.py can emit fixed-size raw
+# RGB565 frames (plus an alpha bitmask) alongside the PNGs; the device
+# then blits logos with one sequential read instead of a zlib inflate
+# and PNG filter pass per display
+LOGO_DECODED_CACHE_DIR = "logos_raw"
+LOGO_DECODED_FORMAT = "rgb565"
+
+# Precomputed home trig, shared by the bbox below and the hot
+# per-aircraft distance filter
+HOME_LAT_RAD = math.radians(HOME_LAT)
+HOME_LON_RAD = math.radians(HOME_LON)
+HOME_COS_LAT = math.cos(HOME_LAT_RAD)
+_EARTH_KM = 6371.0088
+
+# Derived OpenSky bounding box (computed once at import)
+# Passing lamin/lomin/lamax/lomax to /api/states/all shrinks the response
+# from the whole globe to just this box - far fewer bytes over WiFi and
+# far less JSON for the Pico W to parse.
+BBOX_PADDING_KM = 25  # widen the box so planes near the edge are included
+
+_dlat = (SEARCH_RADIUS_KM + BBOX_PADDING_KM) / 111.0
+_dlon = (SEARCH_RADIUS_KM + BBOX_PADDING_KM) / (111.0 * max(HOME_COS_LAT, 1e-6))
+
+BBOX_MIN_LAT = HOME_LAT - _dlat
+BBOX_MAX_LAT = HOME_LAT + _dlat
+BBOX_MIN_LON = HOME_LON - _dlon
+BBOX_MAX_LON = HOME_LON + _dlon
+
+def opensky_bbox():
+    """(lamin, lomin, lamax, lomax) query values for OpenSky states/all."""
+    return (BBOX_MIN_LAT, BBOX_MIN_LON, BBOX_MAX_LAT, BBOX_MAX_LON)
+
+# Coarse location grid for cache keying. Snapping the home position to a
+# 0.25-degree cell lets any fetch-layer cache (on-flash JSON, or a shared
+# relay serving several nearby trackers) reuse one entry for all homes in
+# the same cell instead of keying on raw floats.
+BBOX_GRID_DEG = 0.25
+
+def _snap(x, g):
+    return round(x / g) * g
+
+def cache_key():
+    """Home position snapped to the cache grid: (lat_cell, lon_cell)."""
+    return (_snap(HOME_LAT, BBOX_GRID_DEG), _snap(HOME_LON, BBOX_GRID_DEG))
+
+def within_radius(lat, lon):
+    """Cheap equirectangular radius test: two multiplies and a squared
+    comparison per point, no sqrt and no per-point trig beyond the two
+    radian conversions."""
+    dx = (math.radians(lon) - HOME_LON_RAD) * HOME_COS_LAT
+    dy = math.radians(lat) - HOME_LAT_RAD
+    return (dx * dx + dy * dy) * _EARTH_KM * _EARTH_KM <= SEARCH_RADIUS_KM * SEARCH_RADIUS_KM
+
+def _validate():
+    """Fail fast on configuration that would silently misbehave: a
+    zeroed location or radius yields a garbage bbox that hammers OpenSky
+    for data the filters then throw away."""
+    if not WIFI_SSID:
+        raise ValueError("WIFI_SSID is empty - set it in user_secrets.py")
+    if not -90 <= HOME_LAT <= 90 or not -180 <= HOME_LON <= 180:
+        raise ValueError("HOME_LAT/HOME_LON out of range in user_secrets.py")
+    if HOME_LAT == 0 and HOME_LON == 0:
+        raise ValueError("HOME_LAT/HOME_LON still at the 0,0 placeholder - set your location in user_secrets.py")
+    if not 0 < SEARCH_RADIUS_KM <= 250:
+        raise ValueError("SEARCH_RADIUS_KM must be between 0 and 250")
+    if API_UPDATE_INTERVAL < 5:
+        raise ValueError("API_UPDATE_INTERVAL below 5 s would exhaust the OpenSky budget")
+
+_validate()
@@ -0,0 +1,16 @@
+#!/bin/sh
+# Precompile the configuration modules to bytecode so the device skips
+# parse/compile at boot (faster cold start, less heap churn on the
+# RP2040). secrets.py is just the aggregator; the code actually lives in
+# user_secrets.py and secrets_derived.py, so all three are compiled.
+# Copy the resulting .mpy files to the device alongside main.py; keep
+# editing the .py files and re-run this script after changes.
+#
+# Requires mpy-cross (pip install mpy-cross, or from the MicroPython tree).
+set -e
+cd "$(dirname "$0")/.."
+mpy-cross -march=armv6m user_secrets.py
+mpy-cross -march=armv6m secrets_derived.py
+mpy-cross -march=armv6m secrets.py
+echo "Wrote user_secrets.mpy, secrets_derived.mpy and secrets.mpy"
+echo "(deploy all three next to main.py; secrets.mpy goes on as SECRETS.mpy)"